@@ -9,30 +9,65 @@ Provides high-level Python wrappers around PyMeshLab for:
   - MCP server for AI-assistant integration
 """
 
-from meshlab_tools.connection import MeshlabSession
-from meshlab_tools.alignment import align_icp, align_point_based, global_align
-from meshlab_tools.repair import (
-    remove_duplicate_faces,
-    remove_duplicate_vertices,
-    fill_holes,
-    fix_normals,
-    remove_isolated_pieces,
-    repair_mesh,
-)
-from meshlab_tools.batch import batch_process, batch_repair, batch_align
-
-__all__ = [
-    "MeshlabSession",
-    "align_icp",
-    "align_point_based",
-    "global_align",
-    "remove_duplicate_faces",
-    "remove_duplicate_vertices",
-    "fill_holes",
-    "fix_normals",
-    "remove_isolated_pieces",
-    "repair_mesh",
-    "batch_process",
-    "batch_repair",
-    "batch_align",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from meshlab_tools.connection import MeshlabSession
+    from meshlab_tools.alignment import (
+        align_icp,
+        align_point_based,
+        align_point_based_batch,
+        global_align,
+    )
+    from meshlab_tools.repair import (
+        remove_duplicate_faces,
+        remove_duplicate_vertices,
+        fill_holes,
+        fix_normals,
+        remove_isolated_pieces,
+        repair_mesh,
+    )
+    from meshlab_tools.batch import (
+        batch_process,
+        batch_process_async,
+        batch_repair,
+        batch_align,
+    )
+
+# Public name -> defining submodule.  Submodules (and PyMeshLab with them)
+# are only imported on first attribute access.
+_EXPORTS = {
+    "MeshlabSession": "meshlab_tools.connection",
+    "align_icp": "meshlab_tools.alignment",
+    "align_point_based": "meshlab_tools.alignment",
+    "align_point_based_batch": "meshlab_tools.alignment",
+    "global_align": "meshlab_tools.alignment",
+    "remove_duplicate_faces": "meshlab_tools.repair",
+    "remove_duplicate_vertices": "meshlab_tools.repair",
+    "fill_holes": "meshlab_tools.repair",
+    "fix_normals": "meshlab_tools.repair",
+    "remove_isolated_pieces": "meshlab_tools.repair",
+    "repair_mesh": "meshlab_tools.repair",
+    "batch_process": "meshlab_tools.batch",
+    "batch_process_async": "meshlab_tools.batch",
+    "batch_repair": "meshlab_tools.batch",
+    "batch_align": "meshlab_tools.batch",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
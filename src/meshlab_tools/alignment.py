@@ -7,10 +7,20 @@ and global registration of multiple meshes using PyMeshLab filters.
 
 from __future__ import annotations
 
-from typing import Optional
+import math
+from functools import partial
+from typing import TYPE_CHECKING, Optional
 
 from meshlab_tools.connection import MeshlabSession
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+# Quadric decimation below a tetrahedron's face count fails (or crashes)
+# inside MeshLab rather than raising a usable error.
+_MIN_DECIMATE_FACES = 4
+
 
 def align_icp(
     session: MeshlabSession,
@@ -19,12 +29,18 @@ def align_icp(
     sample_number: int = 2000,
     max_iterations: int = 75,
     max_distance_fraction: float = 0.01,
+    voxel_size: Optional[float] = None,
+    decimate_face_count: Optional[int] = None,
 ) -> dict:
     """Align *source* onto *target* using Iterative Closest Point (ICP).
 
     The source mesh is moved in-place so that it aligns with the target.
     The target mesh is not modified.
 
+    When *voxel_size* or *decimate_face_count* is given, ICP runs on a
+    simplified copy of the source and the resulting transform is then
+    applied to the full-resolution source.
+
     Parameters
     ----------
     session:
@@ -41,6 +57,14 @@ def align_icp(
     max_distance_fraction:
         Points farther than this fraction of the bounding-box diagonal are
         treated as outliers and excluded from each iteration.
+    voxel_size:
+        If set, register a point-cloud copy of the source simplified so that
+        no two points are closer than this distance (in mesh units).  Must
+        be positive.
+    decimate_face_count:
+        If set (and *voxel_size* is not), register a copy of the source
+        decimated to roughly this many faces by quadric edge collapse.
+        Must be at least 4.
 
     Returns
     -------
@@ -53,19 +77,42 @@ def align_icp(
             transform in-place and returns ``None``, so iteration count and
             final RMS error are not available from the library.
     """
-    ms = session.mesh_set
+    if voxel_size is not None and voxel_size <= 0:
+        raise ValueError(f"voxel_size must be positive, got {voxel_size}")
+    if decimate_face_count is not None and decimate_face_count < _MIN_DECIMATE_FACES:
+        raise ValueError(
+            f"decimate_face_count must be at least {_MIN_DECIMATE_FACES}, "
+            f"got {decimate_face_count}"
+        )
 
-    # compute_matrix_by_icp_between_meshes applies the transform to the
-    # source mesh in-place and returns None; iteration count / RMS are not
-    # exposed by PyMeshLab.
-    ms.compute_matrix_by_icp_between_meshes(
+    ms = session.mesh_set
+    icp = partial(
+        ms.compute_matrix_by_icp_between_meshes,
         referencemesh=target_mesh_id,
-        sourcemesh=source_mesh_id,
         samplenum=sample_number,
         maxiternum=max_iterations,
         trgdistabs=max_distance_fraction,
     )
 
+    # compute_matrix_by_icp_between_meshes applies the transform to the
+    # source mesh in-place and returns None; iteration count / RMS are not
+    # exposed by PyMeshLab.
+    if voxel_size is None and decimate_face_count is None:
+        icp(sourcemesh=source_mesh_id)
+    else:
+        proxy_id = _simplified_copy(
+            ms, source_mesh_id, voxel_size, decimate_face_count
+        )
+        try:
+            icp(sourcemesh=proxy_id)
+            # The copy inherited the source's transform before ICP updated
+            # it, so its matrix is the full placement for the original.
+            matrix = ms.mesh(proxy_id).transform_matrix()
+        finally:
+            session.delete_mesh(proxy_id)
+            ms.set_current_mesh(source_mesh_id)
+        ms.set_matrix(transformmatrix=matrix, compose=False, freeze=False)
+
     return {
         "source_mesh_id": source_mesh_id,
         "target_mesh_id": target_mesh_id,
@@ -75,11 +122,106 @@ def align_icp(
     }
 
 
+def _split_point_pairs(point_pairs):
+    """Convert ``[(src, tgt), ...]`` correspondences into two ``(N, 3)`` arrays."""
+    import numpy as np
+
+    message = "point_pairs must contain ([sx, sy, sz], [tx, ty, tz]) pairs"
+    try:
+        pairs = np.asarray(point_pairs, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError(message) from None
+    if pairs.shape != (len(point_pairs), 2, 3):
+        raise ValueError(message)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def _det3(m) -> float:
+    """Determinant of a 3×3 matrix, expanded over plain floats."""
+    (a, b, c), (d, e, f), (g, h, i) = m.tolist()
+    return a * (e * i - f * h) - b * (d * i - f * g) + c * (d * h - e * g)
+
+
+def _kabsch_transform(source_pts, target_pts):
+    """Return the 4×4 rigid transform that best maps *source_pts* onto *target_pts*.
+
+    Kabsch algorithm.  The right singular vectors of the 3×3 covariance
+    ``H`` are taken from the symmetric eigendecomposition of ``HᵀH``, which
+    is considerably cheaper than a general LAPACK SVD at this size.  Nearly
+    rank-deficient inputs (e.g. collinear points) fall back to
+    :func:`numpy.linalg.svd`.
+    """
+    import numpy as np
+
+    src_centroid = source_pts.mean(axis=0)
+    tgt_centroid = target_pts.mean(axis=0)
+    src_c = source_pts - src_centroid
+    tgt_c = target_pts - tgt_centroid
+
+    H = src_c.T @ tgt_c
+    evals, V = np.linalg.eigh(H.T @ H)
+    # eigh sorts ascending; singular values are wanted in descending order
+    V = V[:, ::-1]
+    s = np.sqrt(np.clip(evals[::-1], 0.0, None))
+
+    if s[1] > 1e-3 * s[0]:
+        U = np.empty((3, 3))
+        U[:, :2] = (H @ V[:, :2]) / s[:2]
+        # Completing U with a cross product makes it a proper rotation, so
+        # det(V) alone decides whether the last axis must be flipped.
+        # (Written out by hand: np.cross costs ~20 µs of dispatch overhead.)
+        (a0, b0), (a1, b1), (a2, b2) = U[:, :2].tolist()
+        U[:, 2] = (a1 * b2 - a2 * b1, a2 * b0 - a0 * b2, a0 * b1 - a1 * b0)
+        d = _det3(V)
+    else:
+        U, _, Vt = np.linalg.svd(H)
+        V = Vt.T
+        # det(V Uᵀ) = det(V)·det(U); both factors are ±1
+        d = _det3(V) * _det3(U)
+
+    # Ensure a proper rotation (det = +1) by scaling the last column of V
+    R = (V * (1.0, 1.0, math.copysign(1.0, d))) @ U.T
+    t = tgt_centroid - R @ src_centroid
+
+    # Build 4×4 homogeneous transform matrix
+    T = np.eye(4)
+    T[:3, :3] = R
+    T[:3, 3] = t
+    return T
+
+
+def _simplified_copy(
+    ms,
+    source_mesh_id: int,
+    voxel_size: Optional[float],
+    decimate_face_count: Optional[int],
+) -> int:
+    """Add a simplified copy of *source_mesh_id* to *ms* and return its ID."""
+    import pymeshlab
+
+    ms.set_current_mesh(source_mesh_id)
+    if voxel_size is not None:
+        ms.generate_simplified_point_cloud(radius=pymeshlab.PureValue(voxel_size))
+        return ms.current_mesh_id()
+
+    ms.generate_copy_of_current_mesh()
+    copy_id = ms.current_mesh_id()
+    try:
+        ms.meshing_decimation_quadric_edge_collapse(targetfacenum=decimate_face_count)
+    except Exception:
+        ms.delete_current_mesh()
+        ms.set_current_mesh(source_mesh_id)
+        raise
+    return copy_id
+
+
 def align_point_based(
     session: MeshlabSession,
     source_mesh_id: int,
     target_mesh_id: int,
     point_pairs: Optional[list[tuple[list[float], list[float]]]] = None,
+    *,
+    point_arrays: Optional[tuple[np.ndarray, np.ndarray]] = None,
 ) -> dict:
     """Compute an alignment transform from manually picked point pairs.
 
@@ -97,15 +239,32 @@ def align_point_based(
         ID of the reference mesh.
     point_pairs:
         List of ``([sx, sy, sz], [tx, ty, tz])`` correspondence pairs.
-        When *None* (or empty), a rigid-body ICP pre-alignment is used
-        as a fallback.
+        When *None* (or empty) and *point_arrays* is not given, a
+        rigid-body ICP pre-alignment is used as a fallback.
+    point_arrays:
+        The same correspondences as a ``(source_points, target_points)``
+        tuple of ``(N, 3)`` arrays with ``N >= 1``.  Takes precedence over
+        *point_pairs* and skips the per-pair conversion, so prefer it in hot
+        loops.
 
     Returns
     -------
     dict
         ``{"source_mesh_id": int, "target_mesh_id": int, "method": str}``
     """
-    if not point_pairs:
+    if point_arrays is not None:
+        import numpy as np
+
+        source_pts, target_pts = (np.asarray(a, dtype=float) for a in point_arrays)
+        if source_pts.ndim != 2 or source_pts.shape[1] != 3 or (
+            source_pts.shape != target_pts.shape
+        ) or len(source_pts) == 0:
+            raise ValueError(
+                "point_arrays must be two non-empty (N, 3) arrays of the same shape"
+            )
+    elif point_pairs:
+        source_pts, target_pts = _split_point_pairs(point_pairs)
+    else:
         # Fall back to ICP when no explicit correspondences are given
         result = align_icp(session, source_mesh_id, target_mesh_id)
         result["method"] = "icp_fallback"
@@ -114,29 +273,7 @@ def align_point_based(
     ms = session.mesh_set
     ms.set_current_mesh(source_mesh_id)
 
-    import numpy as np
-
-    source_pts = np.array([p[0] for p in point_pairs], dtype=float)
-    target_pts = np.array([p[1] for p in point_pairs], dtype=float)
-
-    # Kabsch algorithm: compute optimal rigid-body rotation + translation
-    src_centroid = source_pts.mean(axis=0)
-    tgt_centroid = target_pts.mean(axis=0)
-    src_c = source_pts - src_centroid
-    tgt_c = target_pts - tgt_centroid
-
-    H = src_c.T @ tgt_c
-    U, _, Vt = np.linalg.svd(H)
-    # Ensure a proper rotation (det = +1)
-    d = np.linalg.det(Vt.T @ U.T)
-    D = np.diag([1.0, 1.0, d])
-    R = Vt.T @ D @ U.T
-    t = tgt_centroid - R @ src_centroid
-
-    # Build 4×4 homogeneous transform matrix
-    T = np.eye(4)
-    T[:3, :3] = R
-    T[:3, 3] = t
+    T = _kabsch_transform(source_pts, target_pts)
 
     ms.set_matrix(transformmatrix=T, compose=False, freeze=True, alllayers=False)
 
@@ -144,10 +281,107 @@ def align_point_based(
         "source_mesh_id": source_mesh_id,
         "target_mesh_id": target_mesh_id,
         "method": "point_based",
-        "pairs_used": len(point_pairs),
+        "pairs_used": len(source_pts),
     }
 
 
+def _kabsch_transforms(sources, targets):
+    """Batched :func:`_kabsch_transform` over several point sets.
+
+    *sources* and *targets* are equal-length sequences of ``(N_i, 3)``
+    arrays.  The covariance matrices are accumulated with segmented
+    reductions and solved with a single stacked SVD call.  Returns a
+    ``(B, 4, 4)`` array of transforms.
+    """
+    import numpy as np
+
+    counts = np.array([len(p) for p in sources])
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    src = np.concatenate(sources)
+    tgt = np.concatenate(targets)
+
+    src_centroid = np.add.reduceat(src, starts) / counts[:, None]
+    tgt_centroid = np.add.reduceat(tgt, starts) / counts[:, None]
+    src_c = src - np.repeat(src_centroid, counts, axis=0)
+    tgt_c = tgt - np.repeat(tgt_centroid, counts, axis=0)
+
+    H = np.add.reduceat(src_c[:, :, None] * tgt_c[:, None, :], starts)
+    U, _, Vt = np.linalg.svd(H)
+    V = Vt.transpose(0, 2, 1)
+    # Ensure proper rotations (det = +1): det(V Uᵀ) = det(V)·det(U)
+    d = np.sign(np.linalg.det(V) * np.linalg.det(U))
+    V[:, :, 2] *= d[:, None]
+    R = V @ U.transpose(0, 2, 1)
+    t = tgt_centroid - np.einsum("bij,bj->bi", R, src_centroid)
+
+    T = np.zeros((len(counts), 4, 4))
+    T[:, :3, :3] = R
+    T[:, :3, 3] = t
+    T[:, 3, 3] = 1.0
+    return T
+
+
+def align_point_based_batch(
+    session: MeshlabSession,
+    alignments: list[tuple[int, int, np.ndarray, np.ndarray]],
+) -> list[dict]:
+    """Apply :func:`align_point_based` to many mesh pairs at once.
+
+    All rigid transforms are solved together (one stacked SVD), then
+    applied mesh by mesh.  Useful when correspondences for many scan pairs
+    are already known, e.g. from a photogrammetry pipeline.
+
+    Parameters
+    ----------
+    session:
+        Active :class:`~meshlab_tools.connection.MeshlabSession`.
+    alignments:
+        ``(source_mesh_id, target_mesh_id, source_points, target_points)``
+        tuples, where the point arrays are matching ``(N, 3)``
+        correspondences (``N`` may differ between entries).
+
+    Returns
+    -------
+    list[dict]
+        One :func:`align_point_based`-style result dict per alignment.
+    """
+    import numpy as np
+
+    if not alignments:
+        return []
+
+    sources = []
+    targets = []
+    for _, _, source_pts, target_pts in alignments:
+        source_pts = np.asarray(source_pts, dtype=float)
+        target_pts = np.asarray(target_pts, dtype=float)
+        if source_pts.ndim != 2 or source_pts.shape[1] != 3 or (
+            source_pts.shape != target_pts.shape
+        ) or len(source_pts) == 0:
+            raise ValueError(
+                "each alignment needs two non-empty (N, 3) arrays of the same shape"
+            )
+        sources.append(source_pts)
+        targets.append(target_pts)
+
+    transforms = _kabsch_transforms(sources, targets)
+
+    ms = session.mesh_set
+    results = []
+    for (source_mesh_id, target_mesh_id, _, _), T, source_pts in zip(
+        alignments, transforms, sources
+    ):
+        ms.set_current_mesh(source_mesh_id)
+        ms.set_matrix(transformmatrix=T, compose=False, freeze=True, alllayers=False)
+        results.append({
+            "source_mesh_id": source_mesh_id,
+            "target_mesh_id": target_mesh_id,
+            "method": "point_based",
+            "pairs_used": len(source_pts),
+        })
+    return results
+
+
 def global_align(
     session: MeshlabSession,
     mesh_ids: Optional[list[int]] = None,
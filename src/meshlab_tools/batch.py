@@ -7,9 +7,14 @@ directories of mesh files.
 
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterator, Callable, Optional
 
 from meshlab_tools.connection import MeshlabSession
 from meshlab_tools.repair import repair_mesh
@@ -17,20 +22,320 @@ from meshlab_tools.alignment import align_icp
 
 
 # Supported mesh extensions (PyMeshLab can read/write all of these)
-MESH_EXTENSIONS = {
+MESH_EXTENSIONS = frozenset({
     ".ply", ".obj", ".stl", ".off", ".xyz", ".pts",
     ".3ds", ".dae", ".x3d", ".wrl", ".glb", ".gltf",
-}
+})
 
 
-def _iter_mesh_files(directory: str | os.PathLike) -> list[Path]:
-    """Return all mesh files inside *directory* (non-recursive)."""
-    return sorted(
-        p for p in Path(directory).iterdir()
-        if p.is_file() and p.suffix.lower() in MESH_EXTENSIONS
+def _is_mesh_name(name: str) -> bool:
+    """Return ``True`` if the file *name* has a supported mesh extension."""
+    return os.path.splitext(name)[1].lower() in MESH_EXTENSIONS
+
+
+def _iter_mesh_files(
+    directory: str | os.PathLike, recursive: bool = False
+) -> list[Path]:
+    """Return all mesh files inside *directory*, sorted.
+
+    Entries are filtered on their raw names, so :class:`~pathlib.Path`
+    objects are only built for the files that are kept.
+    """
+    # DirEntry caches the stat result, so is_dir()/is_file() cost no extra
+    # syscall.  Sub-directories are walked with an explicit stack; unreadable
+    # ones (e.g. lost+found) are skipped, as Path.rglob does.
+    root = os.fspath(directory)
+    paths = []
+    pending = [root]
+    while pending:
+        current = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except PermissionError:
+            if current == root:
+                raise
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif entry.is_file() and _is_mesh_name(entry.name):
+                    paths.append(entry.path)
+    files = [Path(p) for p in paths]
+    files.sort()
+    return files
+
+
+def _readahead(path: Path) -> None:
+    """Ask the OS to start reading *path* into the page cache.
+
+    The hint returns immediately, so the disk read overlaps with whatever
+    the caller does next.  A no-op on platforms without ``posix_fadvise``.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _iter_prefetched(files: list[tuple[Path, Path]], depth: int):
+    """Yield *files* while keeping up to *depth* upcoming inputs prefetched.
+
+    The file about to be yielded is never itself read ahead, so one-item
+    lists (as run by the worker pools) cost no extra syscalls.
+    """
+    for mesh_file, _ in files[1:depth + 1]:
+        _readahead(mesh_file)
+    for i, pair in enumerate(files):
+        if i and depth and i + depth < len(files):
+            _readahead(files[i + depth][0])
+        yield pair
+
+
+# Per-worker state set up by executor initializers.  In a process pool the
+# initializer and the tasks share the worker's main thread; in a thread pool
+# the state dies with the worker thread.
+_worker_state = threading.local()
+
+
+def _init_session_worker() -> None:
+    """Executor initializer: create the session this worker reuses."""
+    _worker_state.session = MeshlabSession()
+
+
+def _process_files(
+    files: list[tuple[Path, Path]],
+    operation: Callable[[MeshlabSession], Any],
+    reuse_session: bool = False,
+    prefetch: int = 0,
+) -> list[dict]:
+    """Load, process, and save each ``(mesh_file, out_file)`` pair.
+
+    Top-level (rather than nested) so that it can be pickled and shipped to
+    worker processes.  When *reuse_session* is true, a single session is
+    cleared and reused for every file instead of constructing a new one;
+    in a worker prepared by :func:`_init_session_worker` that session is
+    shared by all of the worker's calls.
+    The next *prefetch* input files are read ahead while the current one is
+    being processed.
+    """
+    session = None
+    if reuse_session:
+        session = getattr(_worker_state, "session", None) or MeshlabSession()
+    records: list[dict] = [None] * len(files)
+    for i, (mesh_file, out_file) in enumerate(_iter_prefetched(files, prefetch)):
+        record: dict = {"input": str(mesh_file), "output": str(out_file)}
+        try:
+            if reuse_session:
+                session.clear()
+            else:
+                session = MeshlabSession()
+            session.load_mesh(mesh_file)
+            operation(session)
+            session.save_mesh(out_file, _create_dirs=False)
+            record["status"] = "ok"
+        except Exception as exc:  # noqa: BLE001
+            record["status"] = "error"
+            record["error"] = str(exc)
+        records[i] = record
+    return records
+
+
+def _error_records(files: list[tuple[Path, Path]], exc: Exception) -> list[dict]:
+    """Mark every ``(mesh_file, out_file)`` pair as failed with *exc*."""
+    return [
+        {
+            "input": str(mesh_file),
+            "output": str(out_file),
+            "status": "error",
+            "error": str(exc),
+        }
+        for mesh_file, out_file in files
+    ]
+
+
+def _init_align_worker(target_path: Path) -> None:
+    """Executor initializer: load the ICP target once for this worker."""
+    try:
+        session = MeshlabSession()
+        target_id = session.load_mesh(target_path)
+    except Exception:  # noqa: BLE001
+        # Left unset: _align_files loads it again and reports the error.
+        return
+    _worker_state.align_target = (target_path, session, target_id)
+
+
+def _align_files(
+    files: list[tuple[Path, Path]],
+    target_path: Path,
+    sample_number: int,
+    max_iterations: int,
+) -> list[dict]:
+    """ICP-align each ``(mesh_file, out_file)`` pair against the target.
+
+    The target mesh is loaded once and stays in the session; each source
+    mesh is deleted again after it has been saved.  A session prepared by
+    :func:`_init_align_worker` for the same target is reused across calls.
+    """
+    cached = getattr(_worker_state, "align_target", None)
+    if cached is not None and cached[0] == target_path:
+        _, session, target_id = cached
+    else:
+        try:
+            session = MeshlabSession()
+            target_id = session.load_mesh(target_path)
+        except Exception as exc:  # noqa: BLE001
+            return _error_records(files, exc)
+
+    records: list[dict] = [None] * len(files)
+    for i, (mesh_file, out_file) in enumerate(files):
+        record: dict = {"input": str(mesh_file), "output": str(out_file)}
+        source_id = None
+        try:
+            source_id = session.load_mesh(mesh_file)
+
+            alignment_result = align_icp(
+                session,
+                source_mesh_id=source_id,
+                target_mesh_id=target_id,
+                sample_number=sample_number,
+                max_iterations=max_iterations,
+            )
+            session.save_mesh(out_file, mesh_id=source_id, _create_dirs=False)
+
+            record["status"] = "ok"
+            record["alignment"] = alignment_result
+        except Exception as exc:  # noqa: BLE001
+            record["status"] = "error"
+            record["error"] = str(exc)
+        finally:
+            if source_id is not None:
+                session.delete_mesh(source_id)
+        records[i] = record
+    return records
+
+
+def _mp_context():
+    """Start method for worker pools created from a running event loop.
+
+    Forking a multi-threaded process (such as the asyncio stdio server) can
+    copy held locks into the child, so ``forkserver`` is used where
+    available and ``spawn`` elsewhere.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
     )
 
 
+def _run_chunked(
+    fn: Callable[[list], list[dict]],
+    items: list,
+    workers: Optional[int],
+    initializer: Optional[Callable[[], None]] = None,
+) -> list[dict]:
+    """Run *fn* over *items* and return the records in item order.
+
+    ``workers=1`` calls *fn* once on all items in the calling process.
+    Otherwise each item is submitted as its own one-item chunk to a process
+    pool (``None`` meaning one worker per CPU), so a few slow files cannot
+    leave the other workers idle; *initializer*, if given, runs once in
+    each worker before its first file.
+    """
+    if not items:
+        return []
+    if workers == 1:
+        return fn(items)
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers or os.cpu_count() or 1, len(items)),
+        mp_context=_mp_context(),
+        initializer=initializer,
+    ) as executor:
+        return [
+            record
+            for chunk in executor.map(fn, [[item] for item in items])
+            for record in chunk
+        ]
+
+
+async def _iter_chunked_async(
+    fn: Callable[[list], list[dict]],
+    items: list,
+    workers: Optional[int],
+    initializer: Optional[Callable[[], None]] = None,
+) -> AsyncIterator[dict]:
+    """Yield the records of *fn* over *items* as each file finishes.
+
+    Every item is submitted as its own one-item chunk so that results
+    arrive in completion order, not input order.  ``workers=1`` runs the
+    files one at a time on a single background thread; otherwise a process
+    pool is used (``None`` meaning one worker per CPU).  *initializer*, if
+    given, runs once in each worker before its first file, so per-worker
+    setup is not repeated for every one-item chunk.  If the consumer stops
+    early or is cancelled, queued files are cancelled without blocking the
+    event loop on the ones already running.
+    """
+    if not items:
+        return
+    loop = asyncio.get_running_loop()
+    if workers == 1:
+        executor = ThreadPoolExecutor(max_workers=1, initializer=initializer)
+    else:
+        executor = ProcessPoolExecutor(
+            max_workers=workers, mp_context=_mp_context(), initializer=initializer
+        )
+    futures = []
+    try:
+        futures = [loop.run_in_executor(executor, fn, [item]) for item in items]
+        for next_done in asyncio.as_completed(futures):
+            for record in await next_done:
+                yield record
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _plan_outputs(
+    input_dir: str | os.PathLike,
+    output_dir: str | os.PathLike,
+    output_format: str,
+    recursive: bool,
+    exclude: Optional[Path] = None,
+) -> list[tuple[Path, Path]]:
+    """Pair every input mesh with its output path, creating output dirs.
+
+    *exclude*, when given, is a resolved path that is skipped.
+    """
+    input_path = Path(input_dir)
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    created_dirs = {output_path}
+    pairs = []
+    for mesh_file in _iter_mesh_files(input_path, recursive=recursive):
+        if exclude is not None and mesh_file.resolve() == exclude:
+            continue
+
+        relative = mesh_file.relative_to(input_path)
+        out_file = output_path / relative.with_suffix(output_format)
+        if out_file.parent not in created_dirs:
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(out_file.parent)
+        pairs.append((mesh_file, out_file))
+    return pairs
+
+
 def batch_process(
     input_dir: str | os.PathLike,
     output_dir: str | os.PathLike,
@@ -38,6 +343,9 @@ def batch_process(
     output_format: str = ".ply",
     *,
     recursive: bool = False,
+    workers: Optional[int] = 1,
+    reuse_session: bool = False,
+    prefetch: int = 2,
 ) -> list[dict]:
     """Apply *operation* to every mesh in *input_dir*.
 
@@ -51,12 +359,23 @@ def batch_process(
     operation:
         Callable ``(session: MeshlabSession) -> Any`` applied to each mesh.
         The function receives a session with exactly one loaded mesh.
+        Must be picklable (e.g. a module-level function or a
+        :func:`functools.partial` of one) when *workers* is not 1.
     output_format:
         File extension (including the dot) for the saved results,
         e.g. ``".ply"`` or ``".obj"``.
     recursive:
         When ``True``, also process meshes in sub-directories while
         preserving the relative directory structure in *output_dir*.
+    workers:
+        Number of worker processes.  ``1`` (the default) processes files
+        serially in the calling process; ``None`` uses one worker per CPU.
+    reuse_session:
+        When ``True``, each worker clears and reuses one session for all
+        of its files instead of constructing a new session per file.
+    prefetch:
+        Number of upcoming input files to read ahead into the OS page
+        cache while the current file is processed.  ``0`` disables it.
 
     Returns
     -------
@@ -64,38 +383,109 @@ def batch_process(
         One result dict per input file with keys ``input``, ``output``,
         ``status``, and (on failure) ``error``.
     """
-    input_path = Path(input_dir)
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    pairs = _plan_outputs(input_dir, output_dir, output_format, recursive)
+    fn = partial(
+        _process_files,
+        operation=operation,
+        reuse_session=reuse_session,
+        prefetch=prefetch,
+    )
+    initializer = _init_session_worker if reuse_session else None
+    return _run_chunked(fn, pairs, workers, initializer)
 
-    if recursive:
-        files = sorted(
-            p for p in input_path.rglob("*")
-            if p.is_file() and p.suffix.lower() in MESH_EXTENSIONS
-        )
-    else:
-        files = _iter_mesh_files(input_path)
 
-    results: list[dict] = []
-    for mesh_file in files:
-        relative = mesh_file.relative_to(input_path)
-        out_file = output_path / relative.with_suffix(output_format)
-        out_file.parent.mkdir(parents=True, exist_ok=True)
+async def batch_process_async(
+    input_dir: str | os.PathLike,
+    output_dir: str | os.PathLike,
+    operation: Callable[[MeshlabSession], Any],
+    output_format: str = ".ply",
+    *,
+    recursive: bool = False,
+    workers: Optional[int] = 1,
+    reuse_session: bool = False,
+    prefetch: int = 2,
+) -> list[dict]:
+    """Asynchronous counterpart of :func:`batch_process`.
 
-        record: dict = {"input": str(mesh_file), "output": str(out_file)}
-        try:
-            session = MeshlabSession()
-            session.load_mesh(mesh_file)
-            operation(session)
-            session.save_mesh(out_file)
-            record["status"] = "ok"
-        except Exception as exc:  # noqa: BLE001
-            record["status"] = "error"
-            record["error"] = str(exc)
+    Files are handed to an executor one at a time (a process pool when
+    *workers* is not 1, otherwise a single background thread), so the event
+    loop stays responsive while meshes are processed.  Parameters and
+    return value are the same as for :func:`batch_process`; records are
+    returned in input order.
+    """
+    pairs = _plan_outputs(input_dir, output_dir, output_format, recursive)
+    fn = partial(
+        _process_files,
+        operation=operation,
+        reuse_session=reuse_session,
+        prefetch=prefetch,
+    )
+    initializer = _init_session_worker if reuse_session else None
+    index = {str(mesh_file): i for i, (mesh_file, _) in enumerate(pairs)}
+    records: list[dict] = [None] * len(pairs)
+    async for record in _iter_chunked_async(fn, pairs, workers, initializer):
+        records[index[record["input"]]] = record
+    return records
 
-        results.append(record)
 
-    return results
+def _repair_job(
+    input_dir: str | os.PathLike,
+    output_dir: str | os.PathLike,
+    output_format: str = ".ply",
+    *,
+    recursive: bool = False,
+    **repair_kwargs: Any,
+) -> tuple[
+    Callable[[list], list[dict]], list[tuple[Path, Path]], Optional[Callable[[], None]]
+]:
+    """Plan a :func:`batch_repair` run.
+
+    Returns the chunk function, its file pairs and a per-worker
+    initializer (``None``: repair needs no per-worker setup).
+    """
+    pairs = _plan_outputs(input_dir, output_dir, output_format, recursive)
+    # A partial of a module-level function stays picklable for the pool.
+    fn = partial(
+        _process_files,
+        operation=partial(repair_mesh, **repair_kwargs),
+        prefetch=2,
+    )
+    return fn, pairs, None
+
+
+def _align_job(
+    input_dir: str | os.PathLike,
+    output_dir: str | os.PathLike,
+    target_mesh: str | os.PathLike,
+    output_format: str = ".ply",
+    *,
+    icp_sample_number: int = 2000,
+    icp_max_iterations: int = 75,
+    recursive: bool = False,
+) -> tuple[
+    Callable[[list], list[dict]], list[tuple[Path, Path]], Optional[Callable[[], None]]
+]:
+    """Plan a :func:`batch_align` run.
+
+    Returns the chunk function, its file pairs and a per-worker initializer
+    that loads the target once, for executors that run one file per task.
+    """
+    target_path = Path(target_mesh)
+    # Skip the target mesh itself if it happens to live in input_dir
+    pairs = _plan_outputs(
+        input_dir,
+        output_dir,
+        output_format,
+        recursive,
+        exclude=target_path.resolve(),
+    )
+    fn = partial(
+        _align_files,
+        target_path=target_path,
+        sample_number=icp_sample_number,
+        max_iterations=icp_max_iterations,
+    )
+    return fn, pairs, partial(_init_align_worker, target_path)
 
 
 def batch_repair(
@@ -110,11 +500,12 @@ def batch_repair(
     remove_small_components: bool = True,
     min_component_size: int = 25,
     recursive: bool = False,
+    workers: Optional[int] = None,
 ) -> list[dict]:
     """Repair every mesh in *input_dir* and write results to *output_dir*.
 
-    Convenience wrapper around :func:`batch_process` that runs
-    :func:`~meshlab_tools.repair.repair_mesh` on each file.
+    Equivalent to :func:`batch_process` with
+    :func:`~meshlab_tools.repair.repair_mesh` as the operation.
 
     Parameters
     ----------
@@ -138,13 +529,20 @@ def batch_repair(
         Minimum face count for a component to survive.
     recursive:
         Process sub-directories recursively.
+    workers:
+        Number of worker processes.  ``None`` (the default) uses one
+        worker per CPU; ``1`` processes files serially.
 
     Returns
     -------
     list[dict]
         Per-file status records (see :func:`batch_process`).
     """
-    repair_kwargs = dict(
+    fn, pairs, initializer = _repair_job(
+        input_dir,
+        output_dir,
+        output_format,
+        recursive=recursive,
         remove_duplicates=remove_duplicates,
         fill_mesh_holes=fill_mesh_holes,
         max_hole_size=max_hole_size,
@@ -152,17 +550,7 @@ def batch_repair(
         remove_small_components=remove_small_components,
         min_component_size=min_component_size,
     )
-
-    def _op(session: MeshlabSession) -> None:
-        repair_mesh(session, **repair_kwargs)
-
-    return batch_process(
-        input_dir,
-        output_dir,
-        _op,
-        output_format=output_format,
-        recursive=recursive,
-    )
+    return _run_chunked(fn, pairs, workers, initializer)
 
 
 def batch_align(
@@ -174,12 +562,13 @@ def batch_align(
     icp_sample_number: int = 2000,
     icp_max_iterations: int = 75,
     recursive: bool = False,
+    workers: Optional[int] = None,
 ) -> list[dict]:
     """ICP-align every mesh in *input_dir* against *target_mesh*.
 
-    Each input mesh is loaded into a fresh session alongside the fixed
-    target mesh and registered via ICP.  Only the aligned source mesh
-    is written to *output_dir*.
+    The target mesh is loaded once per worker; each input mesh is loaded
+    alongside it, registered via ICP, and removed again after saving.
+    Only the aligned source mesh is written to *output_dir*.
 
     Parameters
     ----------
@@ -197,6 +586,9 @@ def batch_align(
         Maximum ICP iterations.
     recursive:
         Process sub-directories recursively.
+    workers:
+        Number of worker processes.  ``None`` (the default) uses one
+        worker per CPU; ``1`` processes files serially.
 
     Returns
     -------
@@ -204,51 +596,13 @@ def batch_align(
         Per-file status records with an additional ``alignment`` key
         containing ICP results when successful.
     """
-    input_path = Path(input_dir)
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-    target_path = Path(target_mesh)
-
-    if recursive:
-        files = sorted(
-            p for p in input_path.rglob("*")
-            if p.is_file() and p.suffix.lower() in MESH_EXTENSIONS
-        )
-    else:
-        files = _iter_mesh_files(input_path)
-
-    results: list[dict] = []
-    for mesh_file in files:
-        # Skip the target mesh itself if it happens to live in input_dir
-        if mesh_file.resolve() == target_path.resolve():
-            continue
-
-        relative = mesh_file.relative_to(input_path)
-        out_file = output_path / relative.with_suffix(output_format)
-        out_file.parent.mkdir(parents=True, exist_ok=True)
-
-        record: dict = {"input": str(mesh_file), "output": str(out_file)}
-        try:
-            session = MeshlabSession()
-            # Load target first (id=0), then source (id=1)
-            session.load_mesh(target_path)
-            source_id = session.load_mesh(mesh_file)
-
-            alignment_result = align_icp(
-                session,
-                source_mesh_id=source_id,
-                target_mesh_id=0,
-                sample_number=icp_sample_number,
-                max_iterations=icp_max_iterations,
-            )
-            session.save_mesh(out_file, mesh_id=source_id)
-
-            record["status"] = "ok"
-            record["alignment"] = alignment_result
-        except Exception as exc:  # noqa: BLE001
-            record["status"] = "error"
-            record["error"] = str(exc)
-
-        results.append(record)
-
-    return results
+    fn, pairs, initializer = _align_job(
+        input_dir,
+        output_dir,
+        target_mesh,
+        output_format,
+        icp_sample_number=icp_sample_number,
+        icp_max_iterations=icp_max_iterations,
+        recursive=recursive,
+    )
+    return _run_chunked(fn, pairs, workers, initializer)
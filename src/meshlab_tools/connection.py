@@ -9,9 +9,11 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import pymeshlab
+if TYPE_CHECKING:
+    import numpy as np
+    import pymeshlab
 
 
 class MeshlabSession:
@@ -31,6 +33,10 @@ class MeshlabSession:
     """
 
     def __init__(self) -> None:
+        # Imported here so that importing meshlab_tools stays cheap for
+        # callers that never open a session.
+        import pymeshlab
+
         self._ms: pymeshlab.MeshSet = pymeshlab.MeshSet()
 
     # ------------------------------------------------------------------
@@ -73,6 +79,33 @@ class MeshlabSession:
         self._ms.load_new_mesh(str(path))
         return self._ms.current_mesh_id()
 
+    def load_mesh_from_arrays(
+        self, vertices: np.ndarray, faces: Optional[np.ndarray] = None
+    ) -> int:
+        """Add a mesh built from vertex and face arrays to the session.
+
+        Parameters
+        ----------
+        vertices:
+            ``(N, 3)`` array of vertex coordinates.
+        faces:
+            ``(M, 3)`` array of vertex indices per triangle.  Omit for a
+            point cloud.
+
+        Returns
+        -------
+        int
+            The mesh ID assigned to the new mesh.
+        """
+        import pymeshlab
+
+        if faces is None:
+            mesh = pymeshlab.Mesh(vertex_matrix=vertices)
+        else:
+            mesh = pymeshlab.Mesh(vertex_matrix=vertices, face_matrix=faces)
+        self._ms.add_mesh(mesh)
+        return self._ms.current_mesh_id()
+
     def save_mesh(
         self,
         path: str | os.PathLike,
@@ -80,6 +113,8 @@ class MeshlabSession:
         save_vertex_color: bool = True,
         save_face_color: bool = True,
         save_wedge_texcoord: bool = True,
+        *,
+        _create_dirs: bool = True,
     ) -> None:
         """Save a mesh to disk.
 
@@ -96,30 +131,47 @@ class MeshlabSession:
         save_wedge_texcoord:
             Preserve wedge texture coordinates when the format supports it.
         """
-        if mesh_id is not None:
-            self._ms.set_current_mesh(mesh_id)
+        self._select(mesh_id)
         save_path = Path(path)
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-        self._ms.save_current_mesh(
-            str(save_path),
-            save_vertex_color=save_vertex_color,
-            save_face_color=save_face_color,
-            save_wedge_texcoord=save_wedge_texcoord,
-        )
+        # Batch callers create every output directory up front and opt out.
+        if _create_dirs:
+            save_path.parent.mkdir(parents=True, exist_ok=True)
+        # PyMeshLab keeps colours and texture coordinates by default, and
+        # formats without them (STL, OFF, …) reject these parameters, so only
+        # the flags that were switched off are passed through.
+        flags = {
+            name: False
+            for name, keep in (
+                ("save_vertex_color", save_vertex_color),
+                ("save_face_color", save_face_color),
+                ("save_wedge_texcoord", save_wedge_texcoord),
+            )
+            if not keep
+        }
+        self._ms.save_current_mesh(str(save_path), **flags)
 
     # ------------------------------------------------------------------
     # Mesh management
     # ------------------------------------------------------------------
 
+    def _select(self, mesh_id: Optional[int]) -> None:
+        """Make *mesh_id* current unless it is ``None`` or already current."""
+        if mesh_id is not None and mesh_id != self._ms.current_mesh_id():
+            self._ms.set_current_mesh(mesh_id)
+
     def set_active_mesh(self, mesh_id: int) -> None:
         """Make *mesh_id* the active mesh."""
         self._ms.set_current_mesh(mesh_id)
 
     def delete_mesh(self, mesh_id: int) -> None:
         """Remove the mesh with *mesh_id* from the session."""
-        self._ms.set_current_mesh(mesh_id)
+        self._select(mesh_id)
         self._ms.delete_current_mesh()
 
+    def clear(self) -> None:
+        """Remove every mesh from the session, keeping the session itself."""
+        self._ms.clear()
+
     def mesh_info(self, mesh_id: Optional[int] = None) -> dict:
         """Return basic statistics for a mesh.
 
@@ -134,12 +186,26 @@ class MeshlabSession:
             Dictionary with keys ``vertex_count``, ``face_count``,
             ``bounding_box``, and ``mesh_id``.
         """
-        if mesh_id is not None:
-            self._ms.set_current_mesh(mesh_id)
-        m = self._ms.current_mesh()
+        self._select(mesh_id)
+        return self._mesh_record(self._ms.current_mesh_id(), self._ms.current_mesh())
+
+    def list_meshes(self) -> list[dict]:
+        """Return info for every mesh currently in the session.
+
+        Meshes are read by reference, so the active mesh is left untouched.
+        """
+        ms = self._ms
+        return [
+            self._mesh_record(mesh_id, ms.mesh(mesh_id))
+            for mesh_id in range(ms.mesh_number())
+        ]
+
+    @staticmethod
+    def _mesh_record(mesh_id: int, m: pymeshlab.Mesh) -> dict:
+        """Build the :meth:`mesh_info` dictionary for mesh *m*."""
         bb = m.bounding_box()
         return {
-            "mesh_id": self._ms.current_mesh_id(),
+            "mesh_id": mesh_id,
             "vertex_count": m.vertex_number(),
             "face_count": m.face_number(),
             "bounding_box": {
@@ -149,16 +215,6 @@ class MeshlabSession:
             },
         }
 
-    def list_meshes(self) -> list[dict]:
-        """Return info for every mesh currently in the session."""
-        results = []
-        original_id = self._ms.current_mesh_id() if self._ms.mesh_number() > 0 else None
-        for mesh_id in range(self._ms.mesh_number()):
-            results.append(self.mesh_info(mesh_id))
-        if original_id is not None:
-            self._ms.set_current_mesh(original_id)
-        return results
-
     # ------------------------------------------------------------------
     # Raw filter access
     # ------------------------------------------------------------------
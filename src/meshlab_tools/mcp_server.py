@@ -15,11 +15,14 @@ Usage::
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
 from pathlib import Path
 from typing import Any
 
+import jsonschema
 import mcp.server.stdio
 import mcp.types as types
 from mcp.server import Server
@@ -27,7 +30,11 @@ from mcp.server import Server
 from meshlab_tools.connection import MeshlabSession
 from meshlab_tools.alignment import align_icp, global_align
 from meshlab_tools.repair import repair_mesh
-from meshlab_tools.batch import batch_repair, batch_align, batch_process
+from meshlab_tools.batch import (
+    _align_job,
+    _iter_chunked_async,
+    _repair_job,
+)
 
 # ---------------------------------------------------------------------------
 # Server setup
@@ -35,281 +42,456 @@ from meshlab_tools.batch import batch_repair, batch_align, batch_process
 
 app = Server("meshlab-tools")
 
+# Tool results are serialised compactly; batch results can hold hundreds of
+# records.  Set MESHLAB_MCP_PRETTY=1 to indent them when debugging.
+_JSON_INDENT = 2 if os.environ.get("MESHLAB_MCP_PRETTY") == "1" else None
+_JSON_SEPARATORS = None if _JSON_INDENT else (",", ":")
+
+
+def _to_json(obj: Any) -> str:
+    return json.dumps(obj, indent=_JSON_INDENT, separators=_JSON_SEPARATORS)
+
 
 # ---------------------------------------------------------------------------
 # Tool definitions
 # ---------------------------------------------------------------------------
 
-@app.list_tools()
-async def list_tools() -> list[types.Tool]:
-    return [
-        types.Tool(
-            name="load_mesh",
-            description=(
-                "Load one or more mesh files into a new MeshLab session and "
-                "return basic statistics (vertex/face counts, bounding box) "
-                "for each mesh."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "paths": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Absolute paths to mesh files to load.",
-                    },
+_TOOLS: list[types.Tool] = [
+    types.Tool(
+        name="load_mesh",
+        description=(
+            "Load one or more mesh files into a new MeshLab session and "
+            "return basic statistics (vertex/face counts, bounding box) "
+            "for each mesh."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Absolute paths to mesh files to load.",
                 },
-                "required": ["paths"],
             },
-        ),
-        types.Tool(
-            name="get_mesh_info",
-            description="Return vertex count, face count, and bounding-box info for a mesh file.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Absolute path to the mesh file.",
-                    },
+            "required": ["paths"],
+        },
+    ),
+    types.Tool(
+        name="get_mesh_info",
+        description="Return vertex count, face count, and bounding-box info for a mesh file.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "Absolute path to the mesh file.",
                 },
-                "required": ["path"],
             },
+            "required": ["path"],
+        },
+    ),
+    types.Tool(
+        name="repair_mesh",
+        description=(
+            "Repair a mesh file by removing duplicates, filling holes, "
+            "reorienting normals, and removing small components. "
+            "Writes the result to output_path."
         ),
-        types.Tool(
-            name="repair_mesh",
-            description=(
-                "Repair a mesh file by removing duplicates, filling holes, "
-                "reorienting normals, and removing small components. "
-                "Writes the result to output_path."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "input_path": {
-                        "type": "string",
-                        "description": "Path to the input mesh file.",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Path to write the repaired mesh.",
-                    },
-                    "remove_duplicates": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Remove duplicate faces and vertices.",
-                    },
-                    "fill_holes": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Fill boundary holes.",
-                    },
-                    "max_hole_size": {
-                        "type": "integer",
-                        "default": 30,
-                        "description": "Maximum boundary-edge count of holes to fill.",
-                    },
-                    "reorient_normals": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Recompute and coherently orient face normals.",
-                    },
-                    "remove_small_components": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Delete small disconnected components.",
-                    },
-                    "min_component_size": {
-                        "type": "integer",
-                        "default": 25,
-                        "description": "Minimum face count to keep a component.",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "input_path": {
+                    "type": "string",
+                    "description": "Path to the input mesh file.",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Path to write the repaired mesh.",
+                },
+                "remove_duplicates": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Remove duplicate faces and vertices.",
+                },
+                "fill_holes": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Fill boundary holes.",
+                },
+                "max_hole_size": {
+                    "type": "integer",
+                    "default": 30,
+                    "description": "Maximum boundary-edge count of holes to fill.",
+                },
+                "reorient_normals": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Recompute and coherently orient face normals.",
+                },
+                "remove_small_components": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Delete small disconnected components.",
+                },
+                "min_component_size": {
+                    "type": "integer",
+                    "default": 25,
+                    "description": "Minimum face count to keep a component.",
                 },
-                "required": ["input_path", "output_path"],
             },
+            "required": ["input_path", "output_path"],
+        },
+    ),
+    types.Tool(
+        name="align_icp",
+        description=(
+            "Align a source mesh onto a target mesh using Iterative "
+            "Closest Point (ICP). Writes the aligned source mesh to "
+            "output_path."
         ),
-        types.Tool(
-            name="align_icp",
-            description=(
-                "Align a source mesh onto a target mesh using Iterative "
-                "Closest Point (ICP). Writes the aligned source mesh to "
-                "output_path."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source_path": {
-                        "type": "string",
-                        "description": "Path to the scan to be aligned.",
-                    },
-                    "target_path": {
-                        "type": "string",
-                        "description": "Path to the fixed reference mesh.",
-                    },
-                    "output_path": {
-                        "type": "string",
-                        "description": "Path to write the aligned source mesh.",
-                    },
-                    "sample_number": {
-                        "type": "integer",
-                        "default": 2000,
-                        "description": "ICP samples per iteration.",
-                    },
-                    "max_iterations": {
-                        "type": "integer",
-                        "default": 75,
-                        "description": "Maximum ICP iterations.",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source_path": {
+                    "type": "string",
+                    "description": "Path to the scan to be aligned.",
+                },
+                "target_path": {
+                    "type": "string",
+                    "description": "Path to the fixed reference mesh.",
+                },
+                "output_path": {
+                    "type": "string",
+                    "description": "Path to write the aligned source mesh.",
+                },
+                "sample_number": {
+                    "type": "integer",
+                    "default": 2000,
+                    "description": "ICP samples per iteration.",
+                },
+                "max_iterations": {
+                    "type": "integer",
+                    "default": 75,
+                    "description": "Maximum ICP iterations.",
+                },
+                "voxel_size": {
+                    "type": ["number", "null"],
+                    "exclusiveMinimum": 0,
+                    "default": None,
+                    "description": (
+                        "If set, run ICP on a point-cloud copy of the "
+                        "source simplified to this minimum point spacing."
+                    ),
+                },
+                "decimate_face_count": {
+                    "type": ["integer", "null"],
+                    "minimum": 4,
+                    "default": None,
+                    "description": (
+                        "If set, run ICP on a copy of the source "
+                        "decimated to about this many faces."
+                    ),
                 },
-                "required": ["source_path", "target_path", "output_path"],
             },
+            "required": ["source_path", "target_path", "output_path"],
+        },
+    ),
+    types.Tool(
+        name="global_align",
+        description=(
+            "Run global registration across all meshes in a session to "
+            "simultaneously minimise pairwise registration errors. "
+            "Loads every mesh in mesh_paths, aligns them, then saves "
+            "each to output_dir."
         ),
-        types.Tool(
-            name="global_align",
-            description=(
-                "Run global registration across all meshes in a session to "
-                "simultaneously minimise pairwise registration errors. "
-                "Loads every mesh in mesh_paths, aligns them, then saves "
-                "each to output_dir."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "mesh_paths": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Paths to mesh files to align globally.",
-                    },
-                    "output_dir": {
-                        "type": "string",
-                        "description": "Directory to write the aligned meshes.",
-                    },
-                    "output_format": {
-                        "type": "string",
-                        "default": ".ply",
-                        "description": "Output file extension (e.g. '.ply', '.obj').",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "mesh_paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Paths to mesh files to align globally.",
+                },
+                "output_dir": {
+                    "type": "string",
+                    "description": "Directory to write the aligned meshes.",
+                },
+                "output_format": {
+                    "type": "string",
+                    "default": ".ply",
+                    "description": "Output file extension (e.g. '.ply', '.obj').",
                 },
-                "required": ["mesh_paths", "output_dir"],
             },
+            "required": ["mesh_paths", "output_dir"],
+        },
+    ),
+    types.Tool(
+        name="batch_repair",
+        description=(
+            "Repair every mesh in an input directory and write results "
+            "to an output directory. Returns one JSON record per file in "
+            "completion order, then a {files, errors} summary."
         ),
-        types.Tool(
-            name="batch_repair",
-            description=(
-                "Repair every mesh in an input directory and write results "
-                "to an output directory."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "input_dir": {
-                        "type": "string",
-                        "description": "Directory containing input mesh files.",
-                    },
-                    "output_dir": {
-                        "type": "string",
-                        "description": "Directory where repaired meshes are saved.",
-                    },
-                    "output_format": {
-                        "type": "string",
-                        "default": ".ply",
-                        "description": "Output file extension.",
-                    },
-                    "remove_duplicates": {"type": "boolean", "default": True},
-                    "fill_holes": {"type": "boolean", "default": True},
-                    "max_hole_size": {"type": "integer", "default": 30},
-                    "reorient_normals": {"type": "boolean", "default": True},
-                    "remove_small_components": {"type": "boolean", "default": True},
-                    "min_component_size": {"type": "integer", "default": 25},
-                    "recursive": {
-                        "type": "boolean",
-                        "default": False,
-                        "description": "Process sub-directories recursively.",
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "input_dir": {
+                    "type": "string",
+                    "description": "Directory containing input mesh files.",
+                },
+                "output_dir": {
+                    "type": "string",
+                    "description": "Directory where repaired meshes are saved.",
+                },
+                "output_format": {
+                    "type": "string",
+                    "default": ".ply",
+                    "description": "Output file extension.",
+                },
+                "remove_duplicates": {"type": "boolean", "default": True},
+                "fill_holes": {"type": "boolean", "default": True},
+                "max_hole_size": {"type": "integer", "default": 30},
+                "reorient_normals": {"type": "boolean", "default": True},
+                "remove_small_components": {"type": "boolean", "default": True},
+                "min_component_size": {"type": "integer", "default": 25},
+                "recursive": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Process sub-directories recursively.",
+                },
+                "workers": {
+                    "type": ["integer", "null"],
+                    "minimum": 1,
+                    "default": None,
+                    "description": "Worker processes to use (null = one per CPU).",
                 },
-                "required": ["input_dir", "output_dir"],
             },
+            "required": ["input_dir", "output_dir"],
+        },
+    ),
+    types.Tool(
+        name="batch_align",
+        description=(
+            "ICP-align every mesh in an input directory against a single "
+            "target (reference) mesh and write aligned meshes to an "
+            "output directory. Returns one JSON record per file in "
+            "completion order, then a {files, errors} summary."
         ),
-        types.Tool(
-            name="batch_align",
-            description=(
-                "ICP-align every mesh in an input directory against a single "
-                "target (reference) mesh and write aligned meshes to an "
-                "output directory."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "input_dir": {
-                        "type": "string",
-                        "description": "Directory of scan files to align.",
-                    },
-                    "target_mesh": {
-                        "type": "string",
-                        "description": "Path to the fixed reference mesh.",
-                    },
-                    "output_dir": {
-                        "type": "string",
-                        "description": "Directory where aligned meshes are saved.",
-                    },
-                    "output_format": {
-                        "type": "string",
-                        "default": ".ply",
-                        "description": "Output file extension.",
-                    },
-                    "icp_sample_number": {"type": "integer", "default": 2000},
-                    "icp_max_iterations": {"type": "integer", "default": 75},
-                    "recursive": {"type": "boolean", "default": False},
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "input_dir": {
+                    "type": "string",
+                    "description": "Directory of scan files to align.",
+                },
+                "target_mesh": {
+                    "type": "string",
+                    "description": "Path to the fixed reference mesh.",
+                },
+                "output_dir": {
+                    "type": "string",
+                    "description": "Directory where aligned meshes are saved.",
+                },
+                "output_format": {
+                    "type": "string",
+                    "default": ".ply",
+                    "description": "Output file extension.",
+                },
+                "icp_sample_number": {"type": "integer", "default": 2000},
+                "icp_max_iterations": {"type": "integer", "default": 75},
+                "recursive": {"type": "boolean", "default": False},
+                "workers": {
+                    "type": ["integer", "null"],
+                    "minimum": 1,
+                    "default": None,
+                    "description": "Worker processes to use (null = one per CPU).",
                 },
-                "required": ["input_dir", "target_mesh", "output_dir"],
             },
-        ),
-    ]
+            "required": ["input_dir", "target_mesh", "output_dir"],
+        },
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[types.Tool]:
+    return _TOOLS
 
 
 # ---------------------------------------------------------------------------
 # Tool handlers
 # ---------------------------------------------------------------------------
 
-@app.call_tool()
+# One compiled validator per tool.  The server's own per-call validation is
+# switched off below because it re-checks the whole schema on every request.
+# Each tool's schema defaults are merged into the arguments once per call,
+# so handlers index ``args`` directly instead of repeating the defaults.
+_VALIDATORS: dict[str, jsonschema.protocols.Validator] = {
+    tool.name: jsonschema.validators.validator_for(tool.inputSchema)(tool.inputSchema)
+    for tool in _TOOLS
+}
+_DEFAULTS: dict[str, dict[str, Any]] = {
+    tool.name: {
+        key: prop["default"]
+        for key, prop in tool.inputSchema["properties"].items()
+        if "default" in prop
+    }
+    for tool in _TOOLS
+}
+
+
+@app.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
     try:
+        validator = _VALIDATORS.get(name)
+        if validator is not None:
+            error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+            if error is not None:
+                raise ValueError(f"Invalid arguments for {name!r}: {error.message}")
+            arguments = {**_DEFAULTS[name], **arguments}
+        if name in _BATCH_TOOLS:
+            return await _stream_batch(name, arguments)
         result = _dispatch(name, arguments)
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+        return [types.TextContent(type="text", text=_to_json(result))]
     except Exception as exc:  # noqa: BLE001
         return [
             types.TextContent(
                 type="text",
-                text=json.dumps({"error": str(exc)}, indent=2),
+                text=_to_json({"error": str(exc)}),
             )
         ]
 
 
+_BATCH_TOOLS = {"batch_repair", "batch_align"}
+
+
+def _batch_job(name: str, args: dict[str, Any]):
+    """Map batch tool arguments onto a ``(chunk_fn, file_pairs, initializer)`` job."""
+    if name == "batch_repair":
+        return _repair_job(
+            args["input_dir"],
+            args["output_dir"],
+            args["output_format"],
+            recursive=args["recursive"],
+            remove_duplicates=args["remove_duplicates"],
+            fill_mesh_holes=args["fill_holes"],
+            max_hole_size=args["max_hole_size"],
+            reorient_normals=args["reorient_normals"],
+            remove_small_components=args["remove_small_components"],
+            min_component_size=args["min_component_size"],
+        )
+    if name == "batch_align":
+        return _align_job(
+            args["input_dir"],
+            args["output_dir"],
+            args["target_mesh"],
+            args["output_format"],
+            icp_sample_number=args["icp_sample_number"],
+            icp_max_iterations=args["icp_max_iterations"],
+            recursive=args["recursive"],
+        )
+    raise ValueError(f"Unknown batch tool: {name!r}")
+
+
+async def _stream_batch(name: str, args: dict[str, Any]) -> list[types.TextContent]:
+    """Run a batch tool, emitting one content item per file as it finishes.
+
+    The items come in completion order and are followed by a final
+    ``{"files": N, "errors": E}`` summary, so even an empty batch returns
+    content.  When the client supplied a progress token, every finished
+    file is also reported immediately through a progress notification
+    carrying its record, so the client does not have to wait for the whole
+    batch.
+    """
+    fn, pairs, initializer = _batch_job(name, args)
+    try:
+        ctx = app.request_context
+    except LookupError:
+        # Called outside a live request (e.g. directly from tests).
+        ctx = None
+    token = ctx.meta.progressToken if ctx is not None and ctx.meta is not None else None
+
+    contents: list[types.TextContent] = []
+    errors = 0
+    stream = _iter_chunked_async(fn, pairs, args["workers"], initializer)
+    async for record in stream:
+        errors += record["status"] == "error"
+        text = _to_json(record)
+        contents.append(types.TextContent(type="text", text=text))
+        if token is not None:
+            await ctx.session.send_progress_notification(
+                token, len(contents), total=len(pairs), message=text
+            )
+    summary = {"files": len(pairs), "errors": errors}
+    contents.append(types.TextContent(type="text", text=_to_json(summary)))
+    return contents
+
+
+@functools.lru_cache(maxsize=256)
+def _mesh_info_cached(path: str, mtime_ns: int, size: int, digest: bytes) -> dict:
+    """Load *path* and return its info.
+
+    *mtime_ns*, *size* and *digest* are only part of the cache key, so a
+    modified file misses the cache and is loaded again.
+    """
+    session = MeshlabSession()
+    session.load_mesh(path)
+    return session.mesh_info()
+
+
+_DIGEST_BLOCK = 64 * 1024
+
+
+def _file_digest(path: str, size: int) -> bytes:
+    """SHA-256 of the first and last 64 KiB of *path*.
+
+    Catches rewrites that preserve the modification time without reading
+    whole meshes; PLY and OBJ headers and vertex data sit in the head.
+    """
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        h.update(f.read(_DIGEST_BLOCK))
+        if size > _DIGEST_BLOCK:
+            f.seek(max(size - _DIGEST_BLOCK, _DIGEST_BLOCK))
+            h.update(f.read(_DIGEST_BLOCK))
+    return h.digest()
+
+
+def _mesh_info(path: str) -> dict:
+    """Return :meth:`MeshlabSession.mesh_info` for a file, cached by content."""
+    st = os.stat(path)
+    return _mesh_info_cached(
+        os.path.abspath(path),
+        st.st_mtime_ns,
+        st.st_size,
+        _file_digest(path, st.st_size),
+    )
+
+
 def _dispatch(name: str, args: dict[str, Any]) -> Any:
     if name == "load_mesh":
-        session = MeshlabSession()
-        infos = []
-        for path in args["paths"]:
-            session.load_mesh(path)
-            infos.append(session.mesh_info())
+        # The session is discarded afterwards, so only the per-file info
+        # matters; mesh_id is the position the file would have in a session.
+        infos = [
+            dict(_mesh_info(path), mesh_id=i)
+            for i, path in enumerate(args["paths"])
+        ]
         return {"meshes": infos}
 
     if name == "get_mesh_info":
-        session = MeshlabSession()
-        session.load_mesh(args["path"])
-        return session.mesh_info()
+        return _mesh_info(args["path"])
 
     if name == "repair_mesh":
         session = MeshlabSession()
         session.load_mesh(args["input_path"])
         result = repair_mesh(
             session,
-            remove_duplicates=args.get("remove_duplicates", True),
-            fill_mesh_holes=args.get("fill_holes", True),
-            max_hole_size=args.get("max_hole_size", 30),
-            reorient_normals=args.get("reorient_normals", True),
-            remove_small_components=args.get("remove_small_components", True),
-            min_component_size=args.get("min_component_size", 25),
+            remove_duplicates=args["remove_duplicates"],
+            fill_mesh_holes=args["fill_holes"],
+            max_hole_size=args["max_hole_size"],
+            reorient_normals=args["reorient_normals"],
+            remove_small_components=args["remove_small_components"],
+            min_component_size=args["min_component_size"],
         )
         session.save_mesh(args["output_path"])
         return {"repair_results": result, "output": args["output_path"]}
@@ -322,8 +504,10 @@ def _dispatch(name: str, args: dict[str, Any]) -> Any:
             session,
             source_mesh_id=source_id,
             target_mesh_id=0,
-            sample_number=args.get("sample_number", 2000),
-            max_iterations=args.get("max_iterations", 75),
+            sample_number=args["sample_number"],
+            max_iterations=args["max_iterations"],
+            voxel_size=args["voxel_size"],
+            decimate_face_count=args["decimate_face_count"],
         )
         session.save_mesh(args["output_path"], mesh_id=source_id)
         return {"alignment": result, "output": args["output_path"]}
@@ -335,7 +519,7 @@ def _dispatch(name: str, args: dict[str, Any]) -> Any:
         result = global_align(session)
         output_dir = Path(args["output_dir"])
         output_dir.mkdir(parents=True, exist_ok=True)
-        fmt = args.get("output_format", ".ply")
+        fmt = args["output_format"]
         outputs = []
         for i, p in enumerate(args["mesh_paths"]):
             out = output_dir / (Path(p).stem + fmt)
@@ -343,33 +527,6 @@ def _dispatch(name: str, args: dict[str, Any]) -> Any:
             outputs.append(str(out))
         return {"alignment": result, "outputs": outputs}
 
-    if name == "batch_repair":
-        results = batch_repair(
-            input_dir=args["input_dir"],
-            output_dir=args["output_dir"],
-            output_format=args.get("output_format", ".ply"),
-            remove_duplicates=args.get("remove_duplicates", True),
-            fill_mesh_holes=args.get("fill_holes", True),
-            max_hole_size=args.get("max_hole_size", 30),
-            reorient_normals=args.get("reorient_normals", True),
-            remove_small_components=args.get("remove_small_components", True),
-            min_component_size=args.get("min_component_size", 25),
-            recursive=args.get("recursive", False),
-        )
-        return {"results": results}
-
-    if name == "batch_align":
-        results = batch_align(
-            input_dir=args["input_dir"],
-            output_dir=args["output_dir"],
-            target_mesh=args["target_mesh"],
-            output_format=args.get("output_format", ".ply"),
-            icp_sample_number=args.get("icp_sample_number", 2000),
-            icp_max_iterations=args.get("icp_max_iterations", 75),
-            recursive=args.get("recursive", False),
-        )
-        return {"results": results}
-
     raise ValueError(f"Unknown tool: {name!r}")
 
 
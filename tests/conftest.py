@@ -3,24 +3,35 @@ Shared fixtures for meshlab_tools tests.
 
 Creates simple synthetic meshes (a single triangle / a small sphere) using
 PyMeshLab so that every test module can rely on them without network access.
+The ``*_arrays`` fixtures hand out the same meshes as ``(vertices, faces)``
+for tests that do not exercise file I/O.
 """
 
 from __future__ import annotations
 
-import numpy as np
-import pymeshlab
-import pytest
+import os
+import shutil
+
+# PyMeshLab's filters use OpenMP, which sizes its pool when the library
+# loads.  The test meshes are tiny, so thread start-up costs more than it
+# saves and worker processes would oversubscribe the CPU.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+import numpy as np  # noqa: E402
+import pymeshlab  # noqa: E402
+import pytest  # noqa: E402
+
+from meshlab_tools.connection import MeshlabSession  # noqa: E402
 
 
 @pytest.fixture(scope="session")
-def triangle_mesh_path(tmp_path_factory) -> str:
+def triangle_mesh_path(tmp_path_factory, triangle_mesh_arrays) -> str:
     """Write a single triangle to a temporary PLY file and return its path."""
     tmp = tmp_path_factory.mktemp("meshes")
     path = str(tmp / "triangle.ply")
 
     ms = pymeshlab.MeshSet()
-    verts = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float64)
-    faces = np.array([[0, 1, 2]], dtype=np.int32)
+    verts, faces = triangle_mesh_arrays
     m = pymeshlab.Mesh(vertex_matrix=verts, face_matrix=faces)
     ms.add_mesh(m)
     ms.save_current_mesh(path)
@@ -37,3 +48,59 @@ def sphere_mesh_path(tmp_path_factory) -> str:
     ms.create_sphere(radius=1.0)
     ms.save_current_mesh(path)
     return path
+
+
+@pytest.fixture
+def mesh_input_dir(tmp_path, sphere_mesh_path, triangle_mesh_path):
+    """Return a fresh ``input`` directory holding ``sphere.ply`` and ``triangle.ply``."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    shutil.copy(sphere_mesh_path, input_dir / "sphere.ply")
+    shutil.copy(triangle_mesh_path, input_dir / "triangle.ply")
+    return input_dir
+
+
+def _frozen(*arrays: np.ndarray) -> tuple[np.ndarray, ...]:
+    """Mark session-wide fixture arrays read-only so no test can alter them.
+
+    pymeshlab.Mesh copies its input, so tests pass them in without copying.
+    """
+    for a in arrays:
+        a.setflags(write=False)
+    return arrays
+
+
+@pytest.fixture(scope="session")
+def triangle_mesh_arrays() -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(vertices, faces)`` for a single triangle."""
+    verts = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float64)
+    faces = np.array([[0, 1, 2]], dtype=np.int32)
+    return _frozen(verts, faces)
+
+
+@pytest.fixture(scope="session")
+def sphere_mesh_arrays() -> tuple[np.ndarray, np.ndarray]:
+    """Return ``(vertices, faces)`` for the sphere behind ``sphere_mesh_path``."""
+    ms = pymeshlab.MeshSet()
+    ms.create_sphere(radius=1.0)
+    m = ms.current_mesh()
+    return _frozen(m.vertex_matrix(), m.face_matrix())
+
+
+@pytest.fixture(scope="session")
+def _shared_session() -> MeshlabSession:
+    return MeshlabSession()
+
+
+@pytest.fixture
+def session(_shared_session) -> MeshlabSession:
+    """Return an empty session, reusing one MeshSet cleared between tests."""
+    _shared_session.clear()
+    return _shared_session
+
+
+@pytest.fixture
+def loaded_sphere_session(session, sphere_mesh_arrays) -> MeshlabSession:
+    """Return an empty session holding the sphere as mesh 0, without disk I/O."""
+    session.load_mesh_from_arrays(*sphere_mesh_arrays)
+    return session
@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
-from meshlab_tools.connection import MeshlabSession
-from meshlab_tools.alignment import align_icp, align_point_based, global_align
+from meshlab_tools.alignment import (
+    _kabsch_transform,
+    _kabsch_transforms,
+    align_icp,
+    align_point_based,
+    align_point_based_batch,
+    global_align,
+)
 
 
-def test_align_icp_returns_dict(sphere_mesh_path):
+@pytest.fixture
+def sphere_pair(loaded_sphere_session, sphere_mesh_arrays):
+    """Fresh session with a target sphere (id 0) and a source sphere (id 1)."""
+    source_id = loaded_sphere_session.load_mesh_from_arrays(*sphere_mesh_arrays)
+    return loaded_sphere_session, 0, source_id
+
+
+def test_align_icp_returns_dict(sphere_pair):
     """ICP alignment should return a dict with expected keys."""
-    session = MeshlabSession()
-    target_id = session.load_mesh(sphere_mesh_path)  # id=0 (target)
-    source_id = session.load_mesh(sphere_mesh_path)  # id=1 (source)
+    session, target_id, source_id = sphere_pair
 
     result = align_icp(
         session,
@@ -22,20 +34,18 @@ def test_align_icp_returns_dict(sphere_mesh_path):
         max_iterations=5,
     )
 
-    assert result["source_mesh_id"] == source_id
-    assert result["target_mesh_id"] == target_id
-    assert "iterations_performed" in result
-    assert "final_rms_error" in result
-    # PyMeshLab does not expose these values; they are None
-    assert result["iterations_performed"] is None
-    assert result["final_rms_error"] is None
+    # PyMeshLab does not expose the iteration count or RMS error; they are None
+    assert result == {
+        "source_mesh_id": source_id,
+        "target_mesh_id": target_id,
+        "iterations_performed": None,
+        "final_rms_error": None,
+    }
 
 
-def test_align_icp_does_not_modify_target(sphere_mesh_path):
+def test_align_icp_does_not_modify_target(sphere_pair):
     """The target mesh vertex count should be unchanged after ICP."""
-    session = MeshlabSession()
-    target_id = session.load_mesh(sphere_mesh_path)
-    source_id = session.load_mesh(sphere_mesh_path)
+    session, target_id, source_id = sphere_pair
 
     before = session.mesh_info(mesh_id=target_id)["vertex_count"]
     align_icp(session, source_mesh_id=source_id, target_mesh_id=target_id,
@@ -45,11 +55,69 @@ def test_align_icp_does_not_modify_target(sphere_mesh_path):
     assert before == after
 
 
-def test_align_point_based_no_pairs_uses_icp_fallback(sphere_mesh_path):
+@pytest.mark.parametrize(
+    "simplify", [{"voxel_size": 0.1}, {"decimate_face_count": 200}]
+)
+def test_align_icp_simplified_source(sphere_pair, simplify):
+    """ICP on a simplified copy should move the full source and drop the copy."""
+    session, target_id, source_id = sphere_pair
+    ms = session.mesh_set
+    offset = np.eye(4)
+    offset[:3, 3] = [0.05, -0.03, 0.02]
+    ms.set_current_mesh(source_id)
+    ms.set_matrix(transformmatrix=offset, freeze=True)
+    vertex_count = ms.mesh(source_id).vertex_number()
+
+    align_icp(session, source_mesh_id=source_id, target_mesh_id=target_id,
+              sample_number=500, max_iterations=50, **simplify)
+
+    assert ms.mesh_number() == 2
+    assert ms.mesh(source_id).vertex_number() == vertex_count
+    residual = ms.mesh(source_id).transform_matrix()[:3, 3] + offset[:3, 3]
+    assert np.linalg.norm(residual) < 0.5 * np.linalg.norm(offset[:3, 3])
+
+
+@pytest.mark.parametrize(
+    "simplify",
+    [
+        {"voxel_size": 0.0},
+        {"voxel_size": -0.1},
+        {"decimate_face_count": 1},
+        {"decimate_face_count": -5},
+    ],
+)
+def test_align_icp_rejects_invalid_simplification(sphere_pair, simplify):
+    """Bad simplification settings should raise before the session is touched."""
+    session, target_id, source_id = sphere_pair
+
+    with pytest.raises(ValueError):
+        align_icp(session, source_mesh_id=source_id, target_mesh_id=target_id,
+                  **simplify)
+
+    assert session.mesh_count == 2
+
+
+def test_align_icp_simplified_source_cleans_up_on_error(sphere_pair, monkeypatch):
+    """A failing ICP must not leave the simplified copy in the session."""
+    session, target_id, source_id = sphere_pair
+
+    def _fail(self, **kwargs):
+        raise RuntimeError("icp failed")
+
+    monkeypatch.setattr(
+        type(session.mesh_set), "compute_matrix_by_icp_between_meshes", _fail
+    )
+    with pytest.raises(RuntimeError, match="icp failed"):
+        align_icp(session, source_mesh_id=source_id, target_mesh_id=target_id,
+                  voxel_size=0.1)
+
+    assert session.mesh_count == 2
+    assert session.current_mesh_id == source_id
+
+
+def test_align_point_based_no_pairs_uses_icp_fallback(sphere_pair):
     """align_point_based with no pairs should fall back to ICP."""
-    session = MeshlabSession()
-    target_id = session.load_mesh(sphere_mesh_path)
-    source_id = session.load_mesh(sphere_mesh_path)
+    session, target_id, source_id = sphere_pair
 
     result = align_point_based(
         session,
@@ -62,11 +130,9 @@ def test_align_point_based_no_pairs_uses_icp_fallback(sphere_mesh_path):
     assert result["source_mesh_id"] == source_id
 
 
-def test_align_point_based_with_pairs(sphere_mesh_path):
+def test_align_point_based_with_pairs(sphere_pair):
     """align_point_based with explicit pairs should return 'point_based'."""
-    session = MeshlabSession()
-    target_id = session.load_mesh(sphere_mesh_path)
-    source_id = session.load_mesh(sphere_mesh_path)
+    session, target_id, source_id = sphere_pair
 
     # Use four simple correspondences (identity transform)
     pairs = [
@@ -87,11 +153,145 @@ def test_align_point_based_with_pairs(sphere_mesh_path):
     assert result["pairs_used"] == 4
 
 
-def test_global_align_returns_dict(sphere_mesh_path):
+def test_align_point_based_with_point_arrays(sphere_pair):
+    """(N, 3) source/target arrays should be accepted in place of pairs."""
+    session, target_id, source_id = sphere_pair
+
+    pts = np.array([[1.0, 0.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    result = align_point_based(
+        session,
+        source_mesh_id=source_id,
+        target_mesh_id=target_id,
+        point_arrays=(pts, pts + 0.5),
+    )
+
+    assert result["method"] == "point_based"
+    assert result["pairs_used"] == 4
+    info = session.mesh_info(mesh_id=source_id)
+    np.testing.assert_allclose(info["bounding_box"]["min"], [-0.5, -0.5, -0.5], atol=1e-6)
+
+
+def test_align_point_based_dense_pairs_moves_source(sphere_pair):
+    """Thousands of correspondences should be solved and applied in one shot."""
+    session, target_id, source_id = sphere_pair
+
+    rng = np.random.default_rng(2)
+    source = rng.normal(size=(10_000, 3))
+    t = np.array([2.0, 0.0, -1.0])
+    pairs = [(p.tolist(), (p + t).tolist()) for p in source]
+
+    result = align_point_based(
+        session,
+        source_mesh_id=source_id,
+        target_mesh_id=target_id,
+        point_pairs=pairs,
+    )
+
+    assert result["pairs_used"] == 10_000
+    bbox = session.mesh_info(mesh_id=source_id)["bounding_box"]
+    np.testing.assert_allclose(bbox["min"], np.array([-1.0, -1.0, -1.0]) + t, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "point_pairs",
+    [
+        [([1.0, 0.0], [1.0, 0.0])] * 4,
+        # Six coordinates per pair, but split 4 + 2 instead of 3 + 3.
+        [([1.0, 0.0, 0.0, 1.0], [1.0, 0.0])] * 4,
+    ],
+)
+def test_align_point_based_rejects_malformed_pairs(sphere_pair, point_pairs):
+    """Pairs that are not 3-D point correspondences should raise ValueError."""
+    session, target_id, source_id = sphere_pair
+
+    with pytest.raises(ValueError):
+        align_point_based(
+            session,
+            source_mesh_id=source_id,
+            target_mesh_id=target_id,
+            point_pairs=point_pairs,
+        )
+
+
+def test_align_point_based_rejects_empty_point_arrays(sphere_pair):
+    """Empty arrays should raise and leave the source mesh untouched."""
+    session, target_id, source_id = sphere_pair
+    before = session.mesh_info(mesh_id=source_id)["bounding_box"]
+
+    with pytest.raises(ValueError):
+        align_point_based(
+            session,
+            source_mesh_id=source_id,
+            target_mesh_id=target_id,
+            point_arrays=(np.empty((0, 3)), np.empty((0, 3))),
+        )
+
+    assert session.mesh_info(mesh_id=source_id)["bounding_box"] == before
+
+
+@pytest.mark.parametrize("planar", [False, True])
+def test_kabsch_transform_recovers_rigid_motion(planar):
+    """The closed-form Kabsch solve should recover a known rotation + translation."""
+    rng = np.random.default_rng(0)
+    source = rng.normal(size=(6, 3))
+    if planar:
+        source[:, 2] = 0.0
+    angle = 0.7
+    R = np.array([
+        [np.cos(angle), -np.sin(angle), 0.0],
+        [np.sin(angle), np.cos(angle), 0.0],
+        [0.0, 0.0, 1.0],
+    ])
+    t = np.array([0.5, -2.0, 3.0])
+    target = source @ R.T + t
+
+    T = _kabsch_transform(source, target)
+
+    np.testing.assert_allclose(T[:3, :3], R, atol=1e-9)
+    np.testing.assert_allclose(T[:3, 3], t, atol=1e-9)
+    np.testing.assert_allclose(T[3], [0.0, 0.0, 0.0, 1.0])
+
+
+def test_kabsch_transforms_matches_single_solve():
+    """The batched solve should agree with the per-set Kabsch transform."""
+    rng = np.random.default_rng(1)
+    sources = [rng.normal(size=(n, 3)) for n in (4, 7, 5)]
+    targets = [
+        src @ np.linalg.qr(rng.normal(size=(3, 3)))[0].T + rng.normal(size=3)
+        for src in sources
+    ]
+
+    batched = _kabsch_transforms(sources, targets)
+
+    for T, src, tgt in zip(batched, sources, targets):
+        np.testing.assert_allclose(T, _kabsch_transform(src, tgt), atol=1e-9)
+
+
+def test_align_point_based_batch(sphere_pair, sphere_mesh_arrays):
+    """align_point_based_batch should return one result per alignment."""
+    session, target_id, id_a = sphere_pair
+    id_b = session.load_mesh_from_arrays(*sphere_mesh_arrays)
+
+    pts = np.array([[1.0, 0.0, 0.0], [-1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    results = align_point_based_batch(
+        session,
+        [(id_a, target_id, pts, pts + 1.0), (id_b, target_id, pts, pts - 1.0)],
+    )
+
+    assert [r["source_mesh_id"] for r in results] == [id_a, id_b]
+    assert all(r["pairs_used"] == 4 for r in results)
+    np.testing.assert_allclose(
+        session.mesh_info(mesh_id=id_a)["bounding_box"]["min"], [0.0, 0.0, 0.0], atol=1e-6
+    )
+    np.testing.assert_allclose(
+        session.mesh_info(mesh_id=id_b)["bounding_box"]["min"], [-2.0, -2.0, -2.0], atol=1e-6
+    )
+
+
+@pytest.mark.slow
+def test_global_align_returns_dict(sphere_pair):
     """global_align should return a dict with aligned_mesh_ids."""
-    session = MeshlabSession()
-    session.load_mesh(sphere_mesh_path)
-    session.load_mesh(sphere_mesh_path)
+    session = sphere_pair[0]
 
     result = global_align(session)
 
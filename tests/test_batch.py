@@ -2,15 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import shutil
+import time
 from pathlib import Path
 
 import pytest
 
-from meshlab_tools.batch import batch_process, batch_repair, MESH_EXTENSIONS
+from meshlab_tools.batch import (
+    _align_job,
+    _iter_chunked_async,
+    _iter_prefetched,
+    _repair_job,
+    _run_chunked,
+    batch_align,
+    batch_process,
+    batch_process_async,
+    batch_repair,
+    MESH_EXTENSIONS,
+)
 from meshlab_tools.connection import MeshlabSession
 
 
+def _noop(session: MeshlabSession) -> None:
+    """Module-level (picklable) no-op operation for worker processes."""
+
+
+def _sleep(session: MeshlabSession) -> None:
+    """Module-level (picklable) slow operation for cancellation tests."""
+    time.sleep(0.5)
+
+
 def test_mesh_extensions_populated():
     assert ".ply" in MESH_EXTENSIONS
     assert ".obj" in MESH_EXTENSIONS
@@ -27,39 +50,247 @@ def test_batch_process_empty_dir(tmp_path):
     assert results == []
 
 
-def test_batch_process_processes_files(sphere_mesh_path, triangle_mesh_path, tmp_path):
+def test_batch_process_processes_files(mesh_input_dir, tmp_path):
     """batch_process should process all mesh files in the input directory."""
+    output_dir = tmp_path / "output"
+    results = batch_process(
+        input_dir=str(mesh_input_dir),
+        output_dir=str(output_dir),
+        operation=lambda s: None,  # no-op
+        output_format=".ply",
+    )
+
+    assert len(results) == 2
+    assert all(r["status"] == "ok" for r in results)
+    assert all(Path(r["output"]).exists() for r in results)
+
+
+def test_batch_process_parallel_workers(mesh_input_dir, tmp_path):
+    """batch_process with several workers should match serial results."""
+    results = batch_process(
+        input_dir=str(mesh_input_dir),
+        output_dir=str(tmp_path / "output"),
+        operation=_noop,
+        workers=2,
+    )
+
+    assert [Path(r["input"]).name for r in results] == ["sphere.ply", "triangle.ply"]
+    assert all(r["status"] == "ok" for r in results)
+    assert all(Path(r["output"]).exists() for r in results)
+
+
+@pytest.mark.parametrize("depth", [0, 1, 2, 10])
+def test_iter_prefetched_yields_every_pair(depth, monkeypatch):
+    """Every pair is yielded once, and each later input is read ahead once."""
+    read = []
+    monkeypatch.setattr("meshlab_tools.batch._readahead", read.append)
+    files = [(Path(f"in_{i}.ply"), Path(f"out_{i}.ply")) for i in range(5)]
+
+    assert list(_iter_prefetched(files, depth)) == files
+    expected = [] if depth == 0 else [mesh_file for mesh_file, _ in files[1:]]
+    assert read == expected
+
+
+def test_iter_prefetched_skips_single_file(monkeypatch):
+    """A one-item list has nothing upcoming to read ahead."""
+    read = []
+    monkeypatch.setattr("meshlab_tools.batch._readahead", read.append)
+    files = [(Path("in.ply"), Path("out.ply"))]
+
+    assert list(_iter_prefetched(files, 2)) == files
+    assert read == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_process_async(mesh_input_dir, tmp_path, workers):
+    """batch_process_async should produce the same records as batch_process."""
+    results = asyncio.run(
+        batch_process_async(
+            input_dir=str(mesh_input_dir),
+            output_dir=str(tmp_path / "output"),
+            operation=_noop,
+            workers=workers,
+        )
+    )
+
+    assert [Path(r["input"]).name for r in results] == ["sphere.ply", "triangle.ply"]
+    assert all(r["status"] == "ok" for r in results)
+    assert all(Path(r["output"]).exists() for r in results)
+
+
+def test_batch_process_async_reuse_session(mesh_input_dir, tmp_path):
+    """A worker's reused session should be cleared between one-file tasks."""
+    sessions = []
+    results = asyncio.run(
+        batch_process_async(
+            input_dir=str(mesh_input_dir),
+            output_dir=str(tmp_path / "output"),
+            operation=lambda s: sessions.append((id(s), s.mesh_count)),
+            reuse_session=True,
+        )
+    )
+
+    assert all(r["status"] == "ok" for r in results)
+    assert [count for _, count in sessions] == [1, 1]
+    assert sessions[0][0] == sessions[1][0]
+
+
+def test_batch_process_async_cancel_does_not_block_loop(sphere_mesh_path, tmp_path):
+    """Cancelling the awaiting task must not wait for the remaining chunks."""
     input_dir = tmp_path / "input"
     input_dir.mkdir()
+    for i in range(4):
+        shutil.copy(sphere_mesh_path, input_dir / f"sphere_{i}.ply")
+
+    async def _cancel_midway():
+        task = asyncio.create_task(
+            batch_process_async(input_dir, tmp_path / "out", _sleep, workers=2)
+        )
+        await asyncio.sleep(0.2)
+        start = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return time.perf_counter() - start
+
+    assert asyncio.run(_cancel_midway()) < 0.25
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_chunked_async_yields_every_file(mesh_input_dir, tmp_path, workers):
+    """Streaming a batch job should yield one record per file."""
+    fn, pairs, _ = _repair_job(mesh_input_dir, tmp_path / "output", remove_small_components=False)
+
+    async def _collect():
+        return [r async for r in _iter_chunked_async(fn, pairs, workers)]
+
+    results = asyncio.run(_collect())
+
+    assert sorted(Path(r["input"]).name for r in results) == ["sphere.ply", "triangle.ply"]
+    assert all(r["status"] == "ok" for r in results)
+
+
+def _slow_chunk(items: list) -> list[dict]:
+    time.sleep(0.5)
+    return [{"input": item} for item in items]
+
+
+def test_iter_chunked_async_cancel_does_not_block_loop():
+    """Stopping a stream early must not wait for the queued files."""
+
+    async def _first_then_stop():
+        stream = _iter_chunked_async(_slow_chunk, list(range(4)), 1)
+        await anext(stream)
+        start = time.perf_counter()
+        await stream.aclose()
+        return time.perf_counter() - start
+
+    assert asyncio.run(_first_then_stop()) < 0.25
+
+
+_worker_tag = None
+
+
+def _tag_worker() -> None:
+    global _worker_tag
+    _worker_tag = "initialized"
+
+
+def _tagged_chunk(items: list) -> list[dict]:
+    return [{"input": item, "tag": _worker_tag, "size": len(items)} for item in items]
+
+
+def test_run_chunked_submits_single_files_in_order():
+    """Pooled runs should submit one file per task and keep item order."""
+    results = _run_chunked(_tagged_chunk, list(range(5)), 2, _tag_worker)
+
+    assert [r["input"] for r in results] == list(range(5))
+    assert all(r["tag"] == "initialized" and r["size"] == 1 for r in results)
+
+
+def test_batch_process_reuse_session(mesh_input_dir, tmp_path):
+    """A reused session should still see exactly one mesh per file."""
+    counts = []
+    results = batch_process(
+        input_dir=str(mesh_input_dir),
+        output_dir=str(tmp_path / "output"),
+        operation=lambda s: counts.append(s.mesh_count),
+        reuse_session=True,
+    )
+
+    assert all(r["status"] == "ok" for r in results)
+    assert counts == [1, 1]
+
+
+def test_batch_process_creates_each_output_dir_once(mesh_input_dir, tmp_path, monkeypatch):
+    """Output directories are made while planning, not again per saved file."""
+    made = []
+    original = Path.mkdir
+    monkeypatch.setattr(
+        Path, "mkdir", lambda self, *a, **kw: made.append(self) or original(self, *a, **kw)
+    )
+    results = batch_process(mesh_input_dir, tmp_path / "output", _noop)
+
+    assert all(r["status"] == "ok" for r in results)
+    assert made == [tmp_path / "output"]
+
+
+def test_batch_process_recursive(sphere_mesh_path, triangle_mesh_path, tmp_path):
+    """recursive=True should mirror the input tree into output_dir."""
+    input_dir = tmp_path / "input"
+    (input_dir / "sub").mkdir(parents=True)
     shutil.copy(sphere_mesh_path, input_dir / "sphere.ply")
-    shutil.copy(triangle_mesh_path, input_dir / "triangle.ply")
+    shutil.copy(triangle_mesh_path, input_dir / "sub" / "triangle.PLY")
+    (input_dir / "sub" / "notes.txt").write_text("not a mesh")
 
     output_dir = tmp_path / "output"
     results = batch_process(
         input_dir=str(input_dir),
         output_dir=str(output_dir),
-        operation=lambda s: None,  # no-op
-        output_format=".ply",
+        operation=lambda s: None,
+        recursive=True,
     )
 
-    assert len(results) == 2
+    assert [Path(r["output"]) for r in results] == [
+        output_dir / "sphere.ply",
+        output_dir / "sub" / "triangle.ply",
+    ]
     assert all(r["status"] == "ok" for r in results)
-    assert all(Path(r["output"]).exists() for r in results)
 
 
-def test_batch_process_records_errors(tmp_path):
+def test_batch_process_skips_unreadable_subdirectories(
+    sphere_mesh_path, tmp_path, monkeypatch
+):
+    """An unreadable sub-directory should be skipped, not abort the batch."""
+    input_dir = tmp_path / "input"
+    (input_dir / "locked").mkdir(parents=True)
+    shutil.copy(sphere_mesh_path, input_dir / "sphere.ply")
+    locked = str(input_dir / "locked")
+    real_scandir = os.scandir
+
+    def scandir(path):
+        if os.fspath(path) == locked:
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", scandir)
+    results = batch_process(
+        input_dir=str(input_dir),
+        output_dir=str(tmp_path / "output"),
+        operation=lambda s: None,
+        recursive=True,
+    )
+
+    assert [Path(r["input"]).name for r in results] == ["sphere.ply"]
+
+
+def test_batch_process_records_errors(triangle_mesh_path, tmp_path):
     """batch_process should record errors without raising."""
     input_dir = tmp_path / "input"
     input_dir.mkdir()
 
-    # Create a valid PLY so the loader accepts it, but the operation fails
-    import pymeshlab, numpy as np
-    ms = pymeshlab.MeshSet()
-    verts = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float64)
-    faces = np.array([[0, 1, 2]], dtype=np.int32)
-    m = pymeshlab.Mesh(vertex_matrix=verts, face_matrix=faces)
-    ms.add_mesh(m)
-    ms.save_current_mesh(str(input_dir / "mesh.ply"))
+    # A valid PLY so the loader accepts it, but the operation fails
+    shutil.copy(triangle_mesh_path, input_dir / "mesh.ply")
 
     def _failing_op(session: MeshlabSession) -> None:
         raise RuntimeError("intentional failure")
@@ -95,6 +326,67 @@ def test_batch_repair_runs(sphere_mesh_path, tmp_path):
     assert Path(results[0]["output"]).exists()
 
 
+def test_batch_align_skips_target(sphere_mesh_path, triangle_mesh_path, tmp_path):
+    """batch_align should align every scan except the target itself."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    target = input_dir / "target.ply"
+    shutil.copy(sphere_mesh_path, target)
+    shutil.copy(sphere_mesh_path, input_dir / "scan_a.ply")
+    shutil.copy(sphere_mesh_path, input_dir / "scan_b.ply")
+
+    results = batch_align(
+        input_dir=str(input_dir),
+        output_dir=str(tmp_path / "output"),
+        target_mesh=str(target),
+        icp_sample_number=200,
+        icp_max_iterations=5,
+        workers=1,
+    )
+
+    assert [Path(r["input"]).name for r in results] == ["scan_a.ply", "scan_b.ply"]
+    assert all(r["status"] == "ok" for r in results)
+    assert all(Path(r["output"]).exists() for r in results)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_chunked_async_align_loads_target_once_per_worker(
+    sphere_mesh_path, tmp_path, workers, monkeypatch
+):
+    """Streaming batch_align should keep one target-loaded session per worker."""
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    target = tmp_path / "target.ply"
+    shutil.copy(sphere_mesh_path, target)
+    for name in ("scan_a.ply", "scan_b.ply", "scan_c.ply"):
+        shutil.copy(sphere_mesh_path, input_dir / name)
+
+    fn, pairs, initializer = _align_job(
+        input_dir, tmp_path / "output", target,
+        icp_sample_number=200, icp_max_iterations=5,
+    )
+    if workers == 1:
+        # The single worker is a thread in this process, so loads are countable.
+        loads = []
+        original = MeshlabSession.load_mesh
+        monkeypatch.setattr(
+            MeshlabSession, "load_mesh",
+            lambda self, path: loads.append(Path(path)) or original(self, path),
+        )
+
+    async def _collect():
+        return [r async for r in _iter_chunked_async(fn, pairs, workers, initializer)]
+
+    results = asyncio.run(_collect())
+
+    assert sorted(Path(r["input"]).name for r in results) == [
+        "scan_a.ply", "scan_b.ply", "scan_c.ply"
+    ]
+    assert all(r["status"] == "ok" for r in results)
+    if workers == 1:
+        assert loads.count(target) == 1
+
+
 def test_batch_process_output_dir_created(sphere_mesh_path, tmp_path):
     """output_dir is created automatically if it does not exist."""
     input_dir = tmp_path / "input"
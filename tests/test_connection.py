@@ -2,62 +2,99 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import pytest
 from meshlab_tools.connection import MeshlabSession
 
 
-def test_session_starts_empty():
+@pytest.fixture(scope="module")
+def two_mesh_session(sphere_mesh_arrays, triangle_mesh_arrays) -> MeshlabSession:
+    """Sphere (mesh 0) and triangle (mesh 1), shared by read-only tests."""
     session = MeshlabSession()
+    session.load_mesh_from_arrays(*sphere_mesh_arrays)
+    session.load_mesh_from_arrays(*triangle_mesh_arrays)
+    return session
+
+
+@pytest.mark.slow
+def test_import_does_not_load_pymeshlab():
+    """Importing the package and its modules should not import PyMeshLab."""
+    code = (
+        "import sys, meshlab_tools, meshlab_tools.batch; "
+        "print('pymeshlab' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_session_starts_empty(session):
     assert session.mesh_count == 0
+    assert session.list_meshes() == []
 
 
-def test_load_mesh_returns_id(sphere_mesh_path):
-    session = MeshlabSession()
+def test_load_mesh_returns_id(session, sphere_mesh_path):
     mesh_id = session.load_mesh(sphere_mesh_path)
-    assert isinstance(mesh_id, int)
+    assert mesh_id == session.current_mesh_id == 0
     assert session.mesh_count == 1
 
 
-def test_load_multiple_meshes(sphere_mesh_path, triangle_mesh_path):
-    session = MeshlabSession()
+def test_load_mesh_from_arrays(session, triangle_mesh_arrays):
+    mesh_id = session.load_mesh_from_arrays(*triangle_mesh_arrays)
+    info = session.mesh_info(mesh_id)
+    assert (info["vertex_count"], info["face_count"]) == (3, 1)
+
+
+def test_load_multiple_meshes(session, sphere_mesh_path, triangle_mesh_path):
     id0 = session.load_mesh(sphere_mesh_path)
     id1 = session.load_mesh(triangle_mesh_path)
     assert session.mesh_count == 2
     assert id0 != id1
 
 
-def test_mesh_info_keys(sphere_mesh_path):
-    session = MeshlabSession()
-    session.load_mesh(sphere_mesh_path)
-    info = session.mesh_info()
-    assert "vertex_count" in info
-    assert "face_count" in info
-    assert "bounding_box" in info
+def test_mesh_info_keys(two_mesh_session):
+    info = two_mesh_session.mesh_info(mesh_id=0)
+    assert {"vertex_count", "face_count", "bounding_box"} <= info.keys()
     assert info["vertex_count"] > 0
     assert info["face_count"] > 0
 
 
-def test_list_meshes(sphere_mesh_path, triangle_mesh_path):
-    session = MeshlabSession()
-    session.load_mesh(sphere_mesh_path)
-    session.load_mesh(triangle_mesh_path)
-    meshes = session.list_meshes()
+def test_list_meshes(two_mesh_session):
+    meshes = two_mesh_session.list_meshes()
     assert len(meshes) == 2
 
 
-def test_save_mesh(sphere_mesh_path, tmp_path):
-    session = MeshlabSession()
-    session.load_mesh(sphere_mesh_path)
-    out = str(tmp_path / "saved.ply")
-    session.save_mesh(out)
-    import os
-    assert os.path.isfile(out)
+def test_list_meshes_keeps_active_mesh(loaded_sphere_session, triangle_mesh_arrays):
+    session = loaded_sphere_session
+    session.load_mesh_from_arrays(*triangle_mesh_arrays)
+    session.set_active_mesh(0)
+    meshes = session.list_meshes()
+    assert [m["mesh_id"] for m in meshes] == [0, 1]
+    assert session.current_mesh_id == 0
 
 
-def test_set_active_mesh(sphere_mesh_path, triangle_mesh_path):
-    session = MeshlabSession()
-    session.load_mesh(sphere_mesh_path)
-    id1 = session.load_mesh(triangle_mesh_path)
+@pytest.mark.parametrize("suffix", [".ply", ".obj", ".stl", ".off"])
+def test_save_mesh(two_mesh_session, tmp_path, suffix):
+    out = tmp_path / f"saved{suffix}"
+    two_mesh_session.save_mesh(out, mesh_id=0)
+    assert out.is_file() and out.stat().st_size > 0
+
+
+def test_clear_empties_session(loaded_sphere_session, triangle_mesh_arrays):
+    session = loaded_sphere_session
+    session.load_mesh_from_arrays(*triangle_mesh_arrays)
+    session.clear()
+    assert session.mesh_count == 0
+    session.load_mesh_from_arrays(*triangle_mesh_arrays)
+    assert session.mesh_info()["face_count"] == 1
+
+
+def test_set_active_mesh(loaded_sphere_session, triangle_mesh_arrays):
+    session = loaded_sphere_session
+    id1 = session.load_mesh_from_arrays(*triangle_mesh_arrays)
     session.set_active_mesh(0)
     assert session.current_mesh_id == 0
     session.set_active_mesh(id1)
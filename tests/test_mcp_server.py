@@ -0,0 +1,158 @@
+"""Tests for the MCP tool dispatcher (mcp_server.py)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("mcp")
+
+from meshlab_tools import mcp_server  # noqa: E402
+
+
+@pytest.mark.slow
+def test_server_import_does_not_load_pymeshlab():
+    """Starting the server (and answering list_tools) must not import PyMeshLab."""
+    code = (
+        "import sys, meshlab_tools.mcp_server; "
+        "print('pymeshlab' in sys.modules, 'numpy' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False False"
+
+
+def test_get_mesh_info_is_cached_until_file_changes(sphere_mesh_path, triangle_mesh_path, tmp_path):
+    """Repeated info queries should hit the cache; a modified file should not."""
+    path = tmp_path / "mesh.ply"
+    shutil.copy(sphere_mesh_path, path)
+    mcp_server._mesh_info_cached.cache_clear()
+
+    first = mcp_server._dispatch("get_mesh_info", {"path": str(path)})
+    second = mcp_server._dispatch("get_mesh_info", {"path": str(path)})
+    assert second == first
+    assert mcp_server._mesh_info_cached.cache_info().hits == 1
+
+    shutil.copy(triangle_mesh_path, path)
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    changed = mcp_server._dispatch("get_mesh_info", {"path": str(path)})
+    assert changed["vertex_count"] == 3
+
+
+def test_get_mesh_info_detects_rewrite_with_preserved_mtime(sphere_mesh_path, tmp_path):
+    """Same size and mtime but different bytes must not hit the cache."""
+    path = tmp_path / "mesh.ply"
+    shutil.copy(sphere_mesh_path, path)
+    st = os.stat(path)
+    mcp_server._mesh_info_cached.cache_clear()
+    before = mcp_server._dispatch("get_mesh_info", {"path": str(path)})
+
+    data = bytearray(path.read_bytes())
+    header_end = data.index(b"end_header\n") + len(b"end_header\n")
+    data[header_end:header_end + 8] = np.float64(5.0).tobytes()  # first x
+    path.write_bytes(data)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    after = mcp_server._dispatch("get_mesh_info", {"path": str(path)})
+    assert mcp_server._mesh_info_cached.cache_info().hits == 0
+    assert after["bounding_box"]["max"][0] == 5.0 != before["bounding_box"]["max"][0]
+
+
+def test_load_mesh_numbers_meshes_in_order(sphere_mesh_path, triangle_mesh_path):
+    result = mcp_server._dispatch(
+        "load_mesh", {"paths": [sphere_mesh_path, triangle_mesh_path]}
+    )
+    assert [m["mesh_id"] for m in result["meshes"]] == [0, 1]
+    assert result["meshes"][1]["face_count"] == 1
+
+
+def test_call_tool_returns_compact_json(sphere_mesh_path):
+    contents = asyncio.run(
+        mcp_server.call_tool("get_mesh_info", {"path": sphere_mesh_path})
+    )
+    text = contents[0].text
+    assert "\n" not in text and ", " not in text
+    assert json.loads(text)["vertex_count"] > 0
+
+
+def test_call_tool_rejects_invalid_arguments():
+    contents = asyncio.run(mcp_server.call_tool("get_mesh_info", {"path": 3}))
+    error = json.loads(contents[0].text)["error"]
+    assert error.startswith("Invalid arguments for 'get_mesh_info'")
+
+
+def test_call_tool_fills_schema_defaults(sphere_mesh_path, tmp_path):
+    """Omitted optional arguments should take the defaults from the schema."""
+    out = tmp_path / "repaired.ply"
+    contents = asyncio.run(
+        mcp_server.call_tool(
+            "repair_mesh", {"input_path": sphere_mesh_path, "output_path": str(out)}
+        )
+    )
+    result = json.loads(contents[0].text)
+    assert result["output"] == str(out)
+    assert out.exists()
+
+
+@pytest.mark.parametrize("tool", ["batch_repair", "batch_align"])
+def test_call_tool_rejects_non_positive_workers(tool, tmp_path):
+    args = {"input_dir": str(tmp_path), "output_dir": str(tmp_path), "workers": 0}
+    if tool == "batch_align":
+        args["target_mesh"] = str(tmp_path / "target.ply")
+    contents = asyncio.run(mcp_server.call_tool(tool, args))
+    error = json.loads(contents[0].text)["error"]
+    assert error.startswith(f"Invalid arguments for {tool!r}")
+
+
+def test_call_tool_streams_one_item_per_batch_file(mesh_input_dir, tmp_path):
+    contents = asyncio.run(
+        mcp_server.call_tool(
+            "batch_repair",
+            {
+                "input_dir": str(mesh_input_dir),
+                "output_dir": str(tmp_path / "out"),
+                "remove_small_components": False,
+                "workers": 1,
+            },
+        )
+    )
+    *records, summary = (json.loads(c.text) for c in contents)
+    assert sorted(os.path.basename(r["input"]) for r in records) == [
+        "sphere.ply", "triangle.ply"
+    ]
+    assert all(r["status"] == "ok" for r in records)
+    assert summary == {"files": 2, "errors": 0}
+
+
+def test_call_tool_empty_batch_returns_summary(tmp_path):
+    contents = asyncio.run(
+        mcp_server.call_tool(
+            "batch_repair",
+            {"input_dir": str(tmp_path), "output_dir": str(tmp_path / "out"), "workers": 1},
+        )
+    )
+    assert [json.loads(c.text) for c in contents] == [{"files": 0, "errors": 0}]
+
+
+@pytest.mark.parametrize(
+    "simplify", [{"voxel_size": 0}, {"decimate_face_count": -1}]
+)
+def test_call_tool_rejects_invalid_icp_simplification(simplify, tmp_path):
+    args = {
+        "source_path": str(tmp_path / "a.ply"),
+        "target_path": str(tmp_path / "b.ply"),
+        "output_path": str(tmp_path / "out.ply"),
+        **simplify,
+    }
+    contents = asyncio.run(mcp_server.call_tool("align_icp", args))
+    error = json.loads(contents[0].text)["error"]
+    assert error.startswith("Invalid arguments for 'align_icp'")